@@ -4,6 +4,7 @@ from app.core.database import Base
 from app.core.config import settings
 from alembic import context
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from app.models import *
 
 # this is the Alembic Config object, which provides
@@ -41,7 +42,7 @@ def run_migrations_offline() -> None:
     """
     url = settings.DATABASE_URL
     context.configure(
-        url=url, target_metadata=target_metadata
+        url=url, target_metadata=target_metadata, literal_binds=True
     )
     with context.begin_transaction():
         context.run_migrations()
@@ -54,10 +55,20 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    engine_options = {}
+    if make_url(settings.DATABASE_URL).drivername in ("postgresql", "postgresql+psycopg2"):
+        # Batch executemany() from data migrations: multi-row VALUES for INSERTs
+        # and execute_batch for UPDATE/DELETE, 1000 rows per round trip.
+        engine_options.update(
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
+            executemany_batch_page_size=1000,
+        )
     connectable = create_engine(
         settings.DATABASE_URL,
         poolclass=pool.NullPool,
-        connect_args={}
+        connect_args={},
+        **engine_options,
     )
     with connectable.connect() as connection:
         context.configure(
@@ -0,0 +1,22 @@
+"""
+Shared helpers for migration scripts.
+
+Import from a revision as ``from app.alembic.helpers import chunked_bulk_insert``.
+"""
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# PostgreSQL multi-row INSERT throughput plateaus around 1000 rows per statement.
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+def chunked_bulk_insert(
+    table: sa.Table,
+    rows: Sequence[dict],
+    chunk: int = BULK_INSERT_CHUNK_SIZE,
+) -> None:
+    """Seed ``rows`` into ``table`` as multi-row INSERTs of at most ``chunk`` rows each."""
+    for start in range(0, len(rows), chunk):
+        op.bulk_insert(table, list(rows[start:start + chunk]))
@@ -37,11 +37,25 @@ def upgrade() -> None:
     )
     op.create_index(op.f("ix_automations_id"), "automations", ["id"], unique=False)
     op.create_index(op.f("ix_automations_user_id"), "automations", ["user_id"], unique=False)
-    op.create_index(op.f("ix_automations_status"), "automations", ["status"], unique=False)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_automations_status"),
+            "automations",
+            ["status"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_automations_status"), table_name="automations")
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_automations_status"),
+            table_name="automations",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
     op.drop_index(op.f("ix_automations_user_id"), table_name="automations")
     op.drop_index(op.f("ix_automations_id"), table_name="automations")
     op.drop_table("automations")
@@ -20,20 +20,47 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column("profiles", sa.Column("headline", sa.String(), nullable=True))
-    op.add_column("profiles", sa.Column("primary_location", sa.String(), nullable=True))
-    op.add_column("profiles", sa.Column("years_experience", sa.String(), nullable=True))
-    op.add_column("profiles", sa.Column("compensation_currency", sa.String(), nullable=True))
-    op.add_column("profiles", sa.Column("top_skills", sa.Text(), nullable=True))
-    op.add_column("profiles", sa.Column("cover_letter_tone", sa.Text(), nullable=True))
-    op.add_column("profiles", sa.Column("matching_preferences", sa.Text(), nullable=True))
+    if op.get_context().dialect.name == "postgresql":
+        # One ALTER TABLE (one lock acquisition) for all seven columns.
+        op.execute(
+            "ALTER TABLE profiles "
+            "ADD COLUMN headline VARCHAR, "
+            "ADD COLUMN primary_location VARCHAR, "
+            "ADD COLUMN years_experience VARCHAR, "
+            "ADD COLUMN compensation_currency VARCHAR, "
+            "ADD COLUMN top_skills TEXT, "
+            "ADD COLUMN cover_letter_tone TEXT, "
+            "ADD COLUMN matching_preferences TEXT"
+        )
+    else:
+        with op.batch_alter_table("profiles") as batch_op:
+            batch_op.add_column(sa.Column("headline", sa.String(), nullable=True))
+            batch_op.add_column(sa.Column("primary_location", sa.String(), nullable=True))
+            batch_op.add_column(sa.Column("years_experience", sa.String(), nullable=True))
+            batch_op.add_column(sa.Column("compensation_currency", sa.String(), nullable=True))
+            batch_op.add_column(sa.Column("top_skills", sa.Text(), nullable=True))
+            batch_op.add_column(sa.Column("cover_letter_tone", sa.Text(), nullable=True))
+            batch_op.add_column(sa.Column("matching_preferences", sa.Text(), nullable=True))
 
 
 def downgrade() -> None:
-    op.drop_column("profiles", "matching_preferences")
-    op.drop_column("profiles", "cover_letter_tone")
-    op.drop_column("profiles", "top_skills")
-    op.drop_column("profiles", "compensation_currency")
-    op.drop_column("profiles", "years_experience")
-    op.drop_column("profiles", "primary_location")
-    op.drop_column("profiles", "headline")
+    if op.get_context().dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE profiles "
+            "DROP COLUMN matching_preferences, "
+            "DROP COLUMN cover_letter_tone, "
+            "DROP COLUMN top_skills, "
+            "DROP COLUMN compensation_currency, "
+            "DROP COLUMN years_experience, "
+            "DROP COLUMN primary_location, "
+            "DROP COLUMN headline"
+        )
+    else:
+        with op.batch_alter_table("profiles") as batch_op:
+            batch_op.drop_column("matching_preferences")
+            batch_op.drop_column("cover_letter_tone")
+            batch_op.drop_column("top_skills")
+            batch_op.drop_column("compensation_currency")
+            batch_op.drop_column("years_experience")
+            batch_op.drop_column("primary_location")
+            batch_op.drop_column("headline")
@@ -18,16 +18,37 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column("users", sa.Column("username", sa.String(), nullable=True))
-    op.add_column("users", sa.Column("email_verified", sa.Boolean(), server_default=sa.false(), nullable=True))
-    op.add_column("users", sa.Column("password_changed_at", sa.DateTime(timezone=True), nullable=True))
-    op.add_column("users", sa.Column("two_factor_enabled", sa.Boolean(), server_default=sa.false(), nullable=True))
+    if op.get_context().dialect.name == "postgresql":
+        # One ALTER TABLE (one lock acquisition) for all four columns.
+        op.execute(
+            "ALTER TABLE users "
+            "ADD COLUMN username VARCHAR, "
+            "ADD COLUMN email_verified BOOLEAN DEFAULT false, "
+            "ADD COLUMN password_changed_at TIMESTAMP WITH TIME ZONE, "
+            "ADD COLUMN two_factor_enabled BOOLEAN DEFAULT false"
+        )
+    else:
+        with op.batch_alter_table("users") as batch_op:
+            batch_op.add_column(sa.Column("username", sa.String(), nullable=True))
+            batch_op.add_column(sa.Column("email_verified", sa.Boolean(), server_default=sa.false(), nullable=True))
+            batch_op.add_column(sa.Column("password_changed_at", sa.DateTime(timezone=True), nullable=True))
+            batch_op.add_column(sa.Column("two_factor_enabled", sa.Boolean(), server_default=sa.false(), nullable=True))
     op.create_index(op.f("ix_users_username"), "users", ["username"], unique=True)
 
 
 def downgrade() -> None:
     op.drop_index(op.f("ix_users_username"), table_name="users")
-    op.drop_column("users", "two_factor_enabled")
-    op.drop_column("users", "password_changed_at")
-    op.drop_column("users", "email_verified")
-    op.drop_column("users", "username")
+    if op.get_context().dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE users "
+            "DROP COLUMN two_factor_enabled, "
+            "DROP COLUMN password_changed_at, "
+            "DROP COLUMN email_verified, "
+            "DROP COLUMN username"
+        )
+    else:
+        with op.batch_alter_table("users") as batch_op:
+            batch_op.drop_column("two_factor_enabled")
+            batch_op.drop_column("password_changed_at")
+            batch_op.drop_column("email_verified")
+            batch_op.drop_column("username")
@@ -5,9 +5,10 @@ Revises: c3d4e5f6a7b8
 Create Date: 2026-02-12
 
 """
+import time
 from typing import Sequence, Union
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 
 
@@ -16,16 +17,39 @@ down_revision: Union[str, Sequence[str], None] = "c3d4e5f6a7b8"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+BACKFILL_BATCH_SIZE = 30000
+
+BACKFILL_SQL = sa.text(
+    "UPDATE jobs SET status = 'pending' "
+    "WHERE id IN (SELECT id FROM jobs WHERE status IS NULL LIMIT :batch_size)"
+)
+
+
+def _backfill_status() -> None:
+    """Fill existing rows in small batches so row locks are held per batch, not per table."""
+    if context.is_offline_mode():
+        op.execute("UPDATE jobs SET status = 'pending' WHERE status IS NULL")
+        return
+    bind = op.get_bind()
+    while bind.execute(BACKFILL_SQL, {"batch_size": BACKFILL_BATCH_SIZE}).rowcount:
+        time.sleep(0.1)
+
 
 def upgrade() -> None:
-    op.add_column(
-        "jobs",
-        sa.Column("status", sa.String(), nullable=False, server_default="pending"),
-    )
-    op.create_index("ix_jobs_status", "jobs", ["status"])
+    # Nullable add + separate default keeps the ALTER metadata-only; existing rows
+    # are backfilled outside the migration transaction before NOT NULL is enforced.
+    op.add_column("jobs", sa.Column("status", sa.String(), nullable=True))
+    op.alter_column("jobs", "status", server_default="pending")
+    with op.get_context().autocommit_block():
+        _backfill_status()
+    op.alter_column("jobs", "status", nullable=False)
+    # CONCURRENTLY cannot run inside a transaction; keeps jobs writable during the build.
+    with op.get_context().autocommit_block():
+        op.create_index("ix_jobs_status", "jobs", ["status"], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
-    op.drop_index("ix_jobs_status", table_name="jobs")
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_jobs_status", table_name="jobs", postgresql_concurrently=True, if_exists=True)
     op.drop_column("jobs", "status")
 
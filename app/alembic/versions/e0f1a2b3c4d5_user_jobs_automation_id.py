@@ -30,10 +30,24 @@ def upgrade() -> None:
         ["id"],
         ondelete="SET NULL",
     )
-    op.create_index(op.f("ix_user_jobs_automation_id"), "user_jobs", ["automation_id"], unique=False)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_user_jobs_automation_id"),
+            "user_jobs",
+            ["automation_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_user_jobs_automation_id"), table_name="user_jobs")
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_user_jobs_automation_id"),
+            table_name="user_jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
     op.drop_constraint("fk_user_jobs_automation_id", "user_jobs", type_="foreignkey")
     op.drop_column("user_jobs", "automation_id")
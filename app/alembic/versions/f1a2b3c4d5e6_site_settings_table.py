@@ -30,10 +30,15 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.execute(
-        "INSERT INTO site_settings (id, maintenance_mode, new_user_registration, require_email_verification, max_automations_per_user, site_name, support_email) "
-        "VALUES (1, false, true, false, 10, 'CrypGo', 'support@crypgo.com')"
-    )
+    # Seed data commits on its own so the DDL transaction stays short.
+    with op.get_context().autocommit_block():
+        op.execute(
+            sa.text(
+                "INSERT INTO site_settings (id, maintenance_mode, new_user_registration, require_email_verification, max_automations_per_user, site_name, support_email) "
+                "VALUES (:id, :mm, :nur, :rev, :max_a, :sn, :se) "
+                "ON CONFLICT (id) DO NOTHING"
+            ).bindparams(id=1, mm=False, nur=True, rev=False, max_a=10, sn="CrypGo", se="support@crypgo.com")
+        )
 
 
 def downgrade() -> None:
@@ -52,11 +52,13 @@ def upgrade() -> None:
         ["id"],
         ondelete="SET NULL",
     )
-    op.create_index("ix_jobs_company_id", "jobs", ["company_id"])
+    with op.get_context().autocommit_block():
+        op.create_index("ix_jobs_company_id", "jobs", ["company_id"], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
-    op.drop_index("ix_jobs_company_id", table_name="jobs")
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_jobs_company_id", table_name="jobs", postgresql_concurrently=True, if_exists=True)
     op.drop_constraint("fk_jobs_company_id", "jobs", type_="foreignkey")
     op.drop_column("jobs", "company_id")
 
@@ -0,0 +1,38 @@
+"""user_jobs (user_id, status, applied_at) index for dashboard queries
+
+Revision ID: i4d5e6f7g8h9
+Revises: h3c4d5e6f7g8
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "i4d5e6f7g8h9"
+down_revision: Union[str, Sequence[str], None] = "h3c4d5e6f7g8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_jobs_user_status_applied",
+            "user_jobs",
+            ["user_id", "status", sa.text("applied_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_jobs_user_status_applied",
+            table_name="user_jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
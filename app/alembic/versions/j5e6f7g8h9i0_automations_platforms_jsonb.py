@@ -0,0 +1,47 @@
+"""automations.platforms as jsonb with GIN index
+
+Revision ID: j5e6f7g8h9i0
+Revises: i4d5e6f7g8h9
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "j5e6f7g8h9i0"
+down_revision: Union[str, Sequence[str], None] = "i4d5e6f7g8h9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "automations",
+        "platforms",
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using="platforms::jsonb",
+    )
+    op.create_index(
+        "ix_automations_platforms_gin",
+        "automations",
+        ["platforms"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_automations_platforms_gin", table_name="automations")
+    op.alter_column(
+        "automations",
+        "platforms",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using="platforms::json",
+    )
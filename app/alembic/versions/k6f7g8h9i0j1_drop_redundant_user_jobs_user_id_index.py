@@ -0,0 +1,26 @@
+"""drop ix_user_jobs_user_id (covered by uq_user_job)
+
+Revision ID: k6f7g8h9i0j1
+Revises: j5e6f7g8h9i0
+Create Date: 2026-02-12
+
+WHERE user_id = ? is served by the leftmost column of uq_user_job
+(user_id, job_id) and of ix_user_jobs_user_status_applied.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "k6f7g8h9i0j1"
+down_revision: Union[str, Sequence[str], None] = "j5e6f7g8h9i0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_user_jobs_user_id"), table_name="user_jobs")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_user_jobs_user_id"), "user_jobs", ["user_id"], unique=False)
@@ -0,0 +1,42 @@
+"""audit_logs created_at DESC index
+
+Revision ID: l7g8h9i0j1k2
+Revises: k6f7g8h9i0j1
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "l7g8h9i0j1k2"
+down_revision: Union[str, Sequence[str], None] = "k6f7g8h9i0j1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_logs_created_at_desc",
+            "audit_logs",
+            [sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.drop_index(op.f("ix_audit_logs_created_at"), table_name="audit_logs")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_audit_logs_created_at"),
+            "audit_logs",
+            ["created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.drop_index("ix_audit_logs_created_at_desc", table_name="audit_logs")
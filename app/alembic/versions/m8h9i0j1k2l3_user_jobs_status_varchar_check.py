@@ -0,0 +1,51 @@
+"""user_jobs.status as VARCHAR + CHECK instead of the userjobstatus enum type
+
+Revision ID: m8h9i0j1k2l3
+Revises: l7g8h9i0j1k2
+Create Date: 2026-02-12
+
+Adding a status later becomes a constraint swap instead of ALTER TYPE.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "m8h9i0j1k2l3"
+down_revision: Union[str, Sequence[str], None] = "l7g8h9i0j1k2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUSES = ("SAVED", "DRAFT", "SUBMITTED", "REVIEWING", "INTERVIEW", "REJECTED", "ACCEPTED", "WITHDRAWN")
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "user_jobs",
+        "status",
+        type_=sa.String(16),
+        existing_type=sa.Enum(*STATUSES, name="userjobstatus"),
+        existing_nullable=False,
+        postgresql_using="status::text",
+    )
+    op.execute("DROP TYPE IF EXISTS userjobstatus")
+    op.create_check_constraint(
+        "ck_user_jobs_status",
+        "user_jobs",
+        "status IN (" + ", ".join(f"'{s}'" for s in STATUSES) + ")",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_user_jobs_status", "user_jobs", type_="check")
+    userjobstatus = sa.Enum(*STATUSES, name="userjobstatus")
+    userjobstatus.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "user_jobs",
+        "status",
+        type_=userjobstatus,
+        existing_type=sa.String(16),
+        existing_nullable=False,
+        postgresql_using="status::userjobstatus",
+    )
@@ -0,0 +1,45 @@
+"""replace ix_automations_status with a partial index on running automations
+
+Revision ID: n9i0j1k2l3m4
+Revises: m8h9i0j1k2l3
+Create Date: 2026-02-12
+
+Only status = 'running' is ever filtered on (admin stats, per-user dashboard);
+most rows are paused and no longer need index maintenance.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "n9i0j1k2l3m4"
+down_revision: Union[str, Sequence[str], None] = "m8h9i0j1k2l3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_automations_running_user_id",
+            "automations",
+            ["user_id"],
+            postgresql_where=sa.text("status = 'running'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.drop_index(op.f("ix_automations_status"), table_name="automations")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_automations_status"),
+            "automations",
+            ["status"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.drop_index("ix_automations_running_user_id", table_name="automations")
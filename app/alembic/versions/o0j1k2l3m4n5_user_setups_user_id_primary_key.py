@@ -0,0 +1,36 @@
+"""user_setups keyed by user_id (drop surrogate id)
+
+Revision ID: o0j1k2l3m4n5
+Revises: n9i0j1k2l3m4
+Create Date: 2026-02-12
+
+user_setups is strictly 1:1 with users; the surrogate id, its index, the
+unique constraint and the unique index on user_id collapse into one PK.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "o0j1k2l3m4n5"
+down_revision: Union[str, Sequence[str], None] = "n9i0j1k2l3m4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_user_setups_user_id"), table_name="user_setups")
+    op.drop_index(op.f("ix_user_setups_id"), table_name="user_setups")
+    op.drop_constraint("user_setups_user_id_key", "user_setups", type_="unique")
+    op.drop_constraint("user_setups_pkey", "user_setups", type_="primary")
+    op.drop_column("user_setups", "id")
+    op.create_primary_key("user_setups_pkey", "user_setups", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("user_setups_pkey", "user_setups", type_="primary")
+    op.execute("ALTER TABLE user_setups ADD COLUMN id SERIAL NOT NULL")
+    op.create_primary_key("user_setups_pkey", "user_setups", ["id"])
+    op.create_unique_constraint("user_setups_user_id_key", "user_setups", ["user_id"])
+    op.create_index(op.f("ix_user_setups_id"), "user_setups", ["id"], unique=False)
+    op.create_index(op.f("ix_user_setups_user_id"), "user_setups", ["user_id"], unique=True)
@@ -0,0 +1,59 @@
+"""audit_logs (actor|action, created_at DESC) indexes replace single-column ones
+
+Revision ID: p1k2l3m4n5o6
+Revises: o0j1k2l3m4n5
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "p1k2l3m4n5o6"
+down_revision: Union[str, Sequence[str], None] = "o0j1k2l3m4n5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_logs_actor_created",
+            "audit_logs",
+            ["actor", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_audit_logs_action_created",
+            "audit_logs",
+            ["action", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.drop_index(op.f("ix_audit_logs_actor"), table_name="audit_logs")
+    op.drop_index(op.f("ix_audit_logs_action"), table_name="audit_logs")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_audit_logs_action"),
+            "audit_logs",
+            ["action"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f("ix_audit_logs_actor"),
+            "audit_logs",
+            ["actor"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.drop_index("ix_audit_logs_action_created", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_actor_created", table_name="audit_logs")
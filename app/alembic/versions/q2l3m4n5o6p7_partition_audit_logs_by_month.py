@@ -0,0 +1,154 @@
+"""range-partition audit_logs by month
+
+Revision ID: q2l3m4n5o6p7
+Revises: p1k2l3m4n5o6
+Create Date: 2026-02-12
+
+audit_logs becomes a RANGE (created_at) partitioned table with one partition
+per month plus a DEFAULT partition as a safety net. Old months can then be
+detached/dropped instead of DELETEd.
+
+Future partitions: run ``SELECT audit_logs_ensure_partitions(3);`` monthly
+(cron / pg_cron). It creates the current and next N months if missing.
+Months that were missed and already have rows in audit_logs_default are moved
+out by audit_logs_create_partition since z1u2v3w4x5y6 (see that revision).
+PostgreSQL only; other dialects keep the plain table.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "q2l3m4n5o6p7"
+down_revision: Union[str, Sequence[str], None] = "p1k2l3m4n5o6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_audit_logs_created_at_desc", "(created_at DESC)"),
+    ("ix_audit_logs_actor_created", "(actor, created_at DESC)"),
+    ("ix_audit_logs_action_created", "(action, created_at DESC)"),
+)
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned")
+    op.execute("ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey")
+    op.execute("DROP INDEX IF EXISTS ix_audit_logs_id")
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    # The partition key must be part of the primary key.
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            id INTEGER NOT NULL DEFAULT nextval('audit_logs_id_seq'),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            actor VARCHAR NOT NULL,
+            action VARCHAR NOT NULL,
+            target VARCHAR NOT NULL,
+            ip VARCHAR NOT NULL DEFAULT '-',
+            CONSTRAINT audit_logs_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION audit_logs_create_partition(month_start date)
+        RETURNS void LANGUAGE plpgsql AS $$
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                'audit_logs_' || to_char(month_start, 'YYYY_MM'),
+                date_trunc('month', month_start)::date,
+                (date_trunc('month', month_start) + interval '1 month')::date
+            );
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION audit_logs_ensure_partitions(months_ahead integer DEFAULT 3)
+        RETURNS void LANGUAGE plpgsql AS $$
+        BEGIN
+            FOR i IN 0..months_ahead LOOP
+                PERFORM audit_logs_create_partition(
+                    (date_trunc('month', now()) + make_interval(months => i))::date
+                );
+            END LOOP;
+        END;
+        $$
+        """
+    )
+    # One partition for every month that already has rows, then the upcoming ones.
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month_start date;
+        BEGIN
+            FOR month_start IN
+                SELECT DISTINCT date_trunc('month', created_at)::date
+                FROM audit_logs_unpartitioned
+                WHERE created_at IS NOT NULL
+            LOOP
+                PERFORM audit_logs_create_partition(month_start);
+            END LOOP;
+            PERFORM audit_logs_ensure_partitions(3);
+        END;
+        $$
+        """
+    )
+
+    op.execute(
+        "INSERT INTO audit_logs (id, created_at, actor, action, target, ip) "
+        "SELECT id, COALESCE(created_at, now()), actor, action, target, ip FROM audit_logs_unpartitioned"
+    )
+    op.execute("DROP TABLE audit_logs_unpartitioned")
+
+    # Defined on the parent; PostgreSQL creates the matching index on every partition.
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON audit_logs {columns}")
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+    op.execute("ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey")
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            id INTEGER NOT NULL DEFAULT nextval('audit_logs_id_seq'),
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            actor VARCHAR NOT NULL,
+            action VARCHAR NOT NULL,
+            target VARCHAR NOT NULL,
+            ip VARCHAR NOT NULL DEFAULT '-',
+            CONSTRAINT audit_logs_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+    op.execute(
+        "INSERT INTO audit_logs (id, created_at, actor, action, target, ip) "
+        "SELECT id, created_at, actor, action, target, ip FROM audit_logs_partitioned"
+    )
+    op.execute("DROP TABLE audit_logs_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS audit_logs_ensure_partitions(integer)")
+    op.execute("DROP FUNCTION IF EXISTS audit_logs_create_partition(date)")
+
+    op.create_index(op.f("ix_audit_logs_id"), "audit_logs", ["id"], unique=False)
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON audit_logs {columns}")
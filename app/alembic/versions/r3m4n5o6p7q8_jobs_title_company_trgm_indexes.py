@@ -0,0 +1,47 @@
+"""pg_trgm GIN indexes on jobs.title and jobs.company
+
+Revision ID: r3m4n5o6p7q8
+Revises: q2l3m4n5o6p7
+Create Date: 2026-02-12
+
+Lets ILIKE '%term%' searches over title/company use an index instead of a
+sequential scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "r3m4n5o6p7q8"
+down_revision: Union[str, Sequence[str], None] = "q2l3m4n5o6p7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_title_trgm",
+            "jobs",
+            ["title"],
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_jobs_company_trgm",
+            "jobs",
+            ["company"],
+            postgresql_using="gin",
+            postgresql_ops={"company": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_jobs_company_trgm", table_name="jobs", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_jobs_title_trgm", table_name="jobs", postgresql_concurrently=True, if_exists=True)
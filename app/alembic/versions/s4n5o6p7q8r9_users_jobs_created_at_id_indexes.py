@@ -0,0 +1,43 @@
+"""(created_at DESC NULLS LAST, id DESC) indexes on users and jobs
+
+Revision ID: s4n5o6p7q8r9
+Revises: r3m4n5o6p7q8
+Create Date: 2026-02-12
+
+Matches the ORDER BY of the paginated admin users/jobs lists, so a page is an
+index range scan instead of a full sort.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "s4n5o6p7q8r9"
+down_revision: Union[str, Sequence[str], None] = "r3m4n5o6p7q8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_created_at_id",
+            "users",
+            [sa.text("created_at DESC NULLS LAST"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_jobs_created_at_id",
+            "jobs",
+            [sa.text("created_at DESC NULLS LAST"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_jobs_created_at_id", table_name="jobs", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_users_created_at_id", table_name="users", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,48 @@
+"""pg_trgm GIN indexes on users.email and users.full_name
+
+Revision ID: t5o6p7q8r9s0
+Revises: s4n5o6p7q8r9
+Create Date: 2026-02-12
+
+Lets the admin users search (ILIKE '%term%' on email/full_name) use an index
+instead of a sequential scan. gin_trgm_ops serves ILIKE directly, so the raw
+columns are indexed rather than lower(...).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "t5o6p7q8r9s0"
+down_revision: Union[str, Sequence[str], None] = "s4n5o6p7q8r9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_email_trgm",
+            "users",
+            ["email"],
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_users_full_name_trgm",
+            "users",
+            ["full_name"],
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_users_full_name_trgm", table_name="users", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_users_email_trgm", table_name="users", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,88 @@
+"""admin_counters table maintained by triggers
+
+Revision ID: u6p7q8r9s0t1
+Revises: t5o6p7q8r9s0
+Create Date: 2026-02-12
+
+Keeps the admin dashboard totals (all users, approved jobs, running
+automations) in admin_counters so /admin/stats reads three rows instead of
+counting whole tables. Row-level triggers adjust the counts in the same
+transaction as the write; the counters are seeded from live COUNTs while the
+new triggers' locks keep the tables from changing. PostgreSQL only: on other
+dialects the table is created empty and the app falls back to live counts.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "u6p7q8r9s0t1"
+down_revision: Union[str, Sequence[str], None] = "t5o6p7q8r9s0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (counter key, table, predicate over a row variable; None counts every row)
+COUNTERS = [
+    ("users", "users", None),
+    ("active_jobs", "jobs", "{row}.status = 'approved'"),
+    ("running_automations", "automations", "{row}.status = 'running'"),
+]
+
+
+def _delta(predicate: str, row: str) -> str:
+    if predicate is None:
+        return "1"
+    return f"(COALESCE({predicate.format(row=row)}, false))::int"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "admin_counters",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    for key, table, predicate in COUNTERS:
+        op.execute(
+            f"""
+            CREATE FUNCTION admin_counters_{table}() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            DECLARE
+                delta bigint := 0;
+            BEGIN
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    delta := delta + {_delta(predicate, "NEW")};
+                END IF;
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    delta := delta - {_delta(predicate, "OLD")};
+                END IF;
+                IF delta <> 0 THEN
+                    UPDATE admin_counters SET value = value + delta WHERE key = '{key}';
+                END IF;
+                RETURN NULL;
+            END
+            $$
+            """
+        )
+        events = "INSERT OR DELETE" if predicate is None else "INSERT OR UPDATE OF status OR DELETE"
+        op.execute(
+            f"CREATE TRIGGER admin_counters_{table} AFTER {events} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION admin_counters_{table}()"
+        )
+        where = "" if predicate is None else f" WHERE {predicate.format(row=table)}"
+        op.execute(
+            f"INSERT INTO admin_counters (key, value) SELECT '{key}', count(*) FROM {table}{where}"
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        for _key, table, _predicate in reversed(COUNTERS):
+            op.execute(f"DROP TRIGGER IF EXISTS admin_counters_{table} ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS admin_counters_{table}()")
+    op.drop_table("admin_counters")
@@ -0,0 +1,49 @@
+"""Partial indexes for the admin status filters
+
+Revision ID: v7q8r9s0t1u2
+Revises: u6p7q8r9s0t1
+Create Date: 2026-02-12
+
+One (created_at DESC NULLS LAST, id DESC) index per job status and one over
+suspended users. Each matches the admin list ORDER BY for that filter and
+answers the /alerts COUNT of pending jobs and suspended users. Running
+automations already have ix_automations_running_user_id.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "v7q8r9s0t1u2"
+down_revision: Union[str, Sequence[str], None] = "u6p7q8r9s0t1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, WHERE clause)
+PARTIAL_INDEXES = [
+    ("ix_jobs_pending_created_at_id", "jobs", "status = 'pending'"),
+    ("ix_jobs_approved_created_at_id", "jobs", "status = 'approved'"),
+    ("ix_jobs_rejected_created_at_id", "jobs", "status = 'rejected'"),
+    ("ix_users_suspended_created_at_id", "users", "is_active IS FALSE"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, where in PARTIAL_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [sa.text("created_at DESC NULLS LAST"), sa.text("id DESC")],
+                postgresql_where=sa.text(where),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _where in reversed(PARTIAL_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,45 @@
+"""user_jobs (user_id, [status,] created_at DESC, id DESC) indexes for list pages
+
+Revision ID: w8r9s0t1u2v3
+Revises: v7q8r9s0t1u2
+Create Date: 2026-02-12
+
+GET /user-jobs pages with ORDER BY created_at DESC, id DESC, optionally filtered
+by status. These indexes return each page in order instead of sorting all of a
+user's rows per request. audit_logs already has ix_audit_logs_actor_created.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "w8r9s0t1u2v3"
+down_revision: Union[str, Sequence[str], None] = "v7q8r9s0t1u2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, leading columns)
+INDEXES = [
+    ("ix_user_jobs_user_created_id", ["user_id"]),
+    ("ix_user_jobs_user_status_created_id", ["user_id", "status"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "user_jobs",
+                [*columns, sa.text("created_at DESC"), sa.text("id DESC")],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _columns in reversed(INDEXES):
+            op.drop_index(name, table_name="user_jobs", postgresql_concurrently=True, if_exists=True)
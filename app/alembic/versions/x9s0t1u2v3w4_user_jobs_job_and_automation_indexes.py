@@ -0,0 +1,66 @@
+"""user_jobs indexes for applicant lists and applications-today counters
+
+Revision ID: x9s0t1u2v3w4
+Revises: w8r9s0t1u2v3
+Create Date: 2026-02-12
+
+(job_id, applied_at DESC NULLS LAST, created_at DESC) returns a job's applicants
+in list order. (automation_id, status, applied_at) answers the applications-today
+COUNTs from the index alone. They replace the single-column job_id and
+automation_id indexes, which are their leftmost columns. profiles.user_id is
+already indexed by its unique constraint.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "x9s0t1u2v3w4"
+down_revision: Union[str, Sequence[str], None] = "w8r9s0t1u2v3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (new index, columns, single-column index it replaces, that index's column)
+INDEXES = [
+    (
+        "ix_user_jobs_job_applied_created",
+        ["job_id", sa.text("applied_at DESC NULLS LAST"), sa.text("created_at DESC")],
+        "ix_user_jobs_job_id",
+        "job_id",
+    ),
+    (
+        "ix_user_jobs_automation_status_applied",
+        ["automation_id", "status", "applied_at"],
+        "ix_user_jobs_automation_id",
+        "automation_id",
+    ),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns, replaced, _column in INDEXES:
+            op.create_index(
+                name,
+                "user_jobs",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(replaced, table_name="user_jobs", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _columns, replaced, column in reversed(INDEXES):
+            op.create_index(
+                replaced,
+                "user_jobs",
+                [column],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(name, table_name="user_jobs", postgresql_concurrently=True, if_exists=True)
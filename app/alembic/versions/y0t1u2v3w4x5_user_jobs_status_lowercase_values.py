@@ -0,0 +1,39 @@
+"""user_jobs.status stores UserJobStatus values ('saved') instead of names ('SAVED')
+
+Revision ID: y0t1u2v3w4x5
+Revises: x9s0t1u2v3w4
+Create Date: 2026-02-12
+
+The column is now a plain String in the model, so rows hold the same strings the
+API returns and reads skip the per-row Enum conversion. ck_user_jobs_status is
+rebuilt over the lowercase values.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "y0t1u2v3w4x5"
+down_revision: Union[str, Sequence[str], None] = "x9s0t1u2v3w4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUSES = ("saved", "draft", "submitted", "reviewing", "interview", "rejected", "accepted", "withdrawn")
+
+
+def _status_check(statuses) -> str:
+    return "status IN (" + ", ".join(f"'{s}'" for s in statuses) + ")"
+
+
+def upgrade() -> None:
+    op.drop_constraint("ck_user_jobs_status", "user_jobs", type_="check")
+    op.execute("UPDATE user_jobs SET status = lower(status)")
+    op.create_check_constraint("ck_user_jobs_status", "user_jobs", _status_check(STATUSES))
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_user_jobs_status", "user_jobs", type_="check")
+    op.execute("UPDATE user_jobs SET status = upper(status)")
+    op.create_check_constraint(
+        "ck_user_jobs_status", "user_jobs", _status_check(s.upper() for s in STATUSES)
+    )
@@ -0,0 +1,98 @@
+"""audit_logs_create_partition moves rows out of the DEFAULT partition
+
+Revision ID: z1u2v3w4x5y6
+Revises: y0t1u2v3w4x5
+Create Date: 2026-02-12
+
+If audit_logs_ensure_partitions() is not run in time, new rows land in
+audit_logs_default. Creating that month's partition afterwards used to fail with
+"updated partition constraint for default partition would be violated", which
+also aborted every later month in the same ensure_partitions() call.
+
+audit_logs_create_partition() now detaches the DEFAULT partition, creates the
+month, moves that month's rows over and re-attaches DEFAULT, all in the
+caller's transaction. Catching up is then just:
+
+    SELECT audit_logs_create_partition(date '2026-05-01');  -- per stranded month
+    SELECT audit_logs_ensure_partitions(3);
+
+To see which months are stranded:
+``SELECT DISTINCT date_trunc('month', created_at) FROM audit_logs_default;``
+PostgreSQL only.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "z1u2v3w4x5y6"
+down_revision: Union[str, Sequence[str], None] = "y0t1u2v3w4x5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    # DETACH/ATTACH take an ACCESS EXCLUSIVE lock on audit_logs, so concurrent
+    # inserts wait for the move instead of failing while DEFAULT is detached.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION audit_logs_create_partition(month_start date)
+        RETURNS void LANGUAGE plpgsql AS $$
+        DECLARE
+            part_name text := 'audit_logs_' || to_char(month_start, 'YYYY_MM');
+            lo date := date_trunc('month', month_start)::date;
+            hi date := (date_trunc('month', month_start) + interval '1 month')::date;
+        BEGIN
+            IF to_regclass(part_name) IS NOT NULL THEN
+                RETURN;
+            END IF;
+
+            IF NOT EXISTS (
+                SELECT 1 FROM audit_logs_default WHERE created_at >= lo AND created_at < hi
+            ) THEN
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                    part_name, lo, hi
+                );
+                RETURN;
+            END IF;
+
+            ALTER TABLE audit_logs DETACH PARTITION audit_logs_default;
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                part_name, lo, hi
+            );
+            INSERT INTO audit_logs (id, created_at, actor, action, target, ip)
+            SELECT id, created_at, actor, action, target, ip
+            FROM audit_logs_default
+            WHERE created_at >= lo AND created_at < hi;
+            DELETE FROM audit_logs_default WHERE created_at >= lo AND created_at < hi;
+            ALTER TABLE audit_logs ATTACH PARTITION audit_logs_default DEFAULT;
+        END;
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION audit_logs_create_partition(month_start date)
+        RETURNS void LANGUAGE plpgsql AS $$
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                'audit_logs_' || to_char(month_start, 'YYYY_MM'),
+                date_trunc('month', month_start)::date,
+                (date_trunc('month', month_start) + interval '1 month')::date
+            );
+        END;
+        $$
+        """
+    )
@@ -1,47 +1,128 @@
 """
 Shared dependencies for API routes.
+
+FastAPI (pinned in requirements.txt) inspects each dependency's signature and
+sync/async kind once, when routes are built, and caches the results on the
+Dependant; nothing here needs to patch inspect.signature per request.
 """
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
+import math
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from jose import JWTError, jwt
+from jose import JWTError
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.jwt_cache import decode_token
+from app.core.rate_limit import TokenBucketLimiter
 from app.models.user import User
 from app.models.company import Company
+from app.services.adzuna_service import AdzunaService, get_adzuna_client
+from app.services.audit_service import AuditService
 from app.services.auth_service import AuthService
+from app.services.automation_service import AutomationService
+from app.services.company_service import CompanyService
+from app.services.dashboard_service import DashboardService
+from app.services.job_service import JobService
+from app.services.profile_service import ProfileService
+from app.services.settings_service import SettingsService
+from app.services.site_settings_service import SiteSettingsService
+from app.services.user_job_service import UserJobService
+from app.services.user_setup_service import UserSetupService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 
-async def get_current_user(
+# —— Services bound to the request's session ——
+# FastAPI caches each dependency per request, so every endpoint (and nested
+# dependency) asking for a service gets the same instance on the same Session.
+
+
+def get_adzuna_service() -> AdzunaService:
+    return AdzunaService(client=get_adzuna_client())
+
+
+def get_audit_service(db: Session = Depends(get_db)) -> AuditService:
+    return AuditService(db)
+
+
+def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+    return AuthService(db)
+
+
+def get_automation_service(db: Session = Depends(get_db)) -> AutomationService:
+    return AutomationService(db)
+
+
+def get_company_service(db: Session = Depends(get_db)) -> CompanyService:
+    return CompanyService(db)
+
+
+def get_dashboard_service(db: Session = Depends(get_db)) -> DashboardService:
+    return DashboardService(db)
+
+
+def get_job_service(db: Session = Depends(get_db)) -> JobService:
+    return JobService(db)
+
+
+def get_profile_service(db: Session = Depends(get_db)) -> ProfileService:
+    return ProfileService(db)
+
+
+def get_settings_service(
+    db: Session = Depends(get_db),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> SettingsService:
+    return SettingsService(db, auth_service=auth_service)
+
+
+def get_site_settings_service(db: Session = Depends(get_db)) -> SiteSettingsService:
+    return SiteSettingsService(db)
+
+
+def get_user_job_service(db: Session = Depends(get_db)) -> UserJobService:
+    return UserJobService(db)
+
+
+def get_user_setup_service(db: Session = Depends(get_db)) -> UserSetupService:
+    return UserSetupService(db)
+
+
+def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """
     Get the current authenticated user from JWT token.
+
+    The result is memoized on request.state so nested dependencies resolve it once.
     """
+    cached = getattr(request.state, "current_user", None)
+    if cached is not None:
+        return cached
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_token(token)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    
-    auth_service = AuthService(db)
-    user = auth_service.get_user_by_email(email)
+
+    user = auth_service.get_user_for_token(token, email)
     if user is None:
         raise credentials_exception
+    request.state.current_user = user
     return user
 
 
-async def get_current_admin(
+def get_current_admin(
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -55,23 +136,77 @@ async def get_current_admin(
     return current_user
 
 
-async def get_current_company(
+def get_current_company(
+    request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
 ) -> Company:
     """
     Ensure the current user is a company and return their Company profile.
     """
+    cached = getattr(request.state, "company", None)
+    if cached is not None:
+        return cached
     if getattr(current_user, "role", None) != "company":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Company account required.",
         )
-    company = db.query(Company).filter(Company.user_id == current_user.id).first()
+    company = current_user.company
     if not company:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Company profile not found.",
         )
+    request.state.company = company
     return company
 
+
+# —— Auth rate limiting ——
+# Login and signup run bcrypt (~100ms of CPU each); cap attempts before that work
+# so one client cannot tie up the worker threads. Logins are limited per
+# (client IP, username) and, more loosely, per client IP; there is no bucket keyed
+# by username alone, so nobody can lock a user out of their account from elsewhere.
+# Sign-ups have their own per-IP bucket so they never spend the login budget.
+#
+# The client IP is request.client.host. Behind a reverse proxy run uvicorn with
+# --proxy-headers --forwarded-allow-ips=<proxy address> so that it is the real
+# client address (from X-Forwarded-For) rather than the proxy's.
+_auth_limiter = TokenBucketLimiter(
+    capacity=settings.AUTH_RATE_LIMIT_BURST,
+    per_minute=settings.AUTH_RATE_LIMIT_PER_MINUTE,
+)
+_auth_ip_limiter = TokenBucketLimiter(
+    capacity=settings.AUTH_IP_RATE_LIMIT_BURST,
+    per_minute=settings.AUTH_IP_RATE_LIMIT_PER_MINUTE,
+)
+
+
+def _client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+def _enforce_auth_rate_limit(*buckets) -> None:
+    retry_after = max(limiter.acquire(key) for limiter, key in buckets)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts. Please try again later.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+def limit_login_attempts(
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+) -> None:
+    """Rate-limit password logins per (client IP, username) and per client IP."""
+    ip = _client_ip(request)
+    _enforce_auth_rate_limit(
+        (_auth_limiter, ("login", ip, form_data.username.strip().lower())),
+        (_auth_ip_limiter, ("login", ip)),
+    )
+
+
+def limit_signup_attempts(request: Request) -> None:
+    """Rate-limit account sign-ups (which hash a password) by client IP."""
+    _enforce_auth_rate_limit((_auth_limiter, ("signup", _client_ip(request))))
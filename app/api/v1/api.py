@@ -1,30 +1,26 @@
 """
 Main API router that includes all endpoint routers.
 """
+from importlib import import_module
+
 from fastapi import APIRouter
-from app.api.v1.endpoints import (
-    jobs,
-    user_jobs,
-    profiles,
-    auth,
-    setup,
-    settings,
-    admin,
-    automations,
-    dashboard,
-    company,
-)
 
-api_router = APIRouter()
+# (endpoint module, URL prefix, OpenAPI tags)
+ROUTERS = [
+    ("app.api.v1.endpoints.auth", "/auth", ["authentication"]),
+    ("app.api.v1.endpoints.company", "/company", ["company"]),
+    ("app.api.v1.endpoints.profiles", "/profiles", ["profiles"]),
+    ("app.api.v1.endpoints.setup", "/setup", ["setup"]),
+    ("app.api.v1.endpoints.settings", "/settings", ["settings"]),
+    ("app.api.v1.endpoints.jobs", "/jobs", ["jobs"]),
+    ("app.api.v1.endpoints.user_jobs", "/user-jobs", ["user-jobs"]),
+    ("app.api.v1.endpoints.automations", "/automations", ["automations"]),
+    ("app.api.v1.endpoints.dashboard", "/dashboard", ["dashboard"]),
+    ("app.api.v1.endpoints.admin", "/admin", ["admin"]),
+]
 
-api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
-api_router.include_router(company.router, prefix="/company", tags=["company"])
-api_router.include_router(profiles.router, prefix="/profiles", tags=["profiles"])
-api_router.include_router(setup.router, prefix="/setup", tags=["setup"])
-api_router.include_router(settings.router, prefix="/settings", tags=["settings"])
-api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
-api_router.include_router(user_jobs.router, prefix="/user-jobs", tags=["user-jobs"])
-api_router.include_router(automations.router, prefix="/automations", tags=["automations"])
-api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
-api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
+api_router = APIRouter()
 
+for module_path, prefix, tags in ROUTERS:
+    module = import_module(module_path)
+    api_router.include_router(module.router, prefix=prefix, tags=tags)
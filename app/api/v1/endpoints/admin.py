@@ -2,18 +2,24 @@
 Admin endpoints (users, jobs, automations, etc.).
 """
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import String, cast, func, literal, null, or_, select, tuple_, union_all, update
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
-from app.api.dependencies import get_current_admin
+from app.api.dependencies import get_audit_service, get_automation_service, get_current_admin, get_job_service, get_site_settings_service
 from app.models.user import User
 from app.models.job import Job
 from app.models.automation import Automation
 from app.models.user_job import UserJob
 from app.models.audit_log import AuditLog
+from app.models.admin_counter import AdminCounter
 from app.schemas.admin import (
     AdminUserOut,
     AdminJobOut,
@@ -29,12 +35,171 @@ from app.schemas.job import JobCreate
 from app.schemas.automation import AutomationUpdate
 from app.services.job_service import JobService
 from app.services.automation_service import AutomationService
-from app.services.site_settings_service import SiteSettingsService
+from app.services.site_settings_service import SiteSettingsService, invalidate_site_settings_cache
 from app.services.audit_service import AuditService
+from app.services.auth_service import invalidate_cached_user
+from app.utils.streaming import STREAM_BATCH_SIZE, dump_json_list, json_list_response, stream_json_array
 
 router = APIRouter()
 
 
+# Columns selected by the admin list endpoints; rows are mapped without building ORM instances.
+_ADMIN_USER_COLUMNS = (
+    User.id,
+    User.full_name,
+    User.username,
+    User.email,
+    User.is_superuser,
+    User.is_active,
+    User.created_at,
+)
+_ADMIN_JOB_LIST_COLUMNS = (
+    Job.id,
+    Job.title,
+    Job.company,
+    Job.status,
+    Job.created_at,
+    Job.location,
+    Job.salary_range,
+    Job.job_type,
+    Job.job_url,
+    Job.source,
+)
+
+# Number of rows returned by the dashboard activity feed.
+_ACTIVITY_LIMIT = 30
+
+# Relative-time buckets for the activity feed, in seconds.
+_MINUTE, _HOUR, _DAY, _WEEK = 60, 3600, 86400, 604800
+
+
+def _rel(dt: datetime | None, now_ts: float) -> str:
+    """Format dt relative to now_ts ("Just now", "5 min ago", ..., "Feb 12")."""
+    if not dt:
+        return ""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    delta = now_ts - dt.timestamp()
+    if delta < _MINUTE:
+        return "Just now"
+    if delta < _HOUR:
+        return f"{int(delta) // _MINUTE} min ago"
+    if delta < _DAY:
+        return f"{int(delta) // _HOUR} hr ago"
+    if delta < _WEEK:
+        d = int(delta) // _DAY
+        return f"{d} day{'s' if d != 1 else ''} ago"
+    return dt.strftime("%b %d")
+
+
+# Dashboard stat cards in display order; only "value" is filled in per request.
+_STAT_CARD_TEMPLATES = (
+    AdminStatCard.model_construct(label="Total users", value="", change="+0 this month", key="users"),
+    AdminStatCard.model_construct(label="Active jobs", value="", change="Approved listings", key="jobs"),
+    AdminStatCard.model_construct(label="Automations", value="", change="Running", key="automations"),
+    AdminStatCard.model_construct(label="Applications (30d)", value="", change="Last 30 days", key="applications"),
+)
+_fmt_count = "{:,}".format
+
+# Rendered JSON bodies of the dashboard stats/alerts endpoints, shared by all admins.
+_dashboard_cache: TTLCache = TTLCache(maxsize=4, ttl=settings.ADMIN_DASHBOARD_CACHE_TTL_SECONDS)
+_dashboard_cache_lock = Lock()
+
+# X-Total-Count of admin list queries, keyed by the filtered SQL and its parameters,
+# so paging through one result set does not re-run the COUNT (a full scan for
+# ILIKE searches) on every page.
+_list_count_cache: TTLCache = TTLCache(maxsize=256, ttl=settings.ADMIN_DASHBOARD_CACHE_TTL_SECONDS)
+_list_count_cache_lock = Lock()
+
+
+def _dashboard_response(body: bytes) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": f"private, max-age={settings.ADMIN_DASHBOARD_CACHE_TTL_SECONDS}"},
+    )
+
+
+def _get_cached_dashboard(key: str) -> Optional[Response]:
+    """Return the cached response for a dashboard endpoint, or None on a miss."""
+    with _dashboard_cache_lock:
+        body = _dashboard_cache.get(key)
+    return _dashboard_response(body) if body is not None else None
+
+
+def _cache_dashboard(key: str, items: list) -> Response:
+    """Render items to JSON once, cache the bytes under key and return them."""
+    body = dump_json_list(items)
+    with _dashboard_cache_lock:
+        _dashboard_cache[key] = body
+    return _dashboard_response(body)
+
+
+def _invalidate_dashboard_cache() -> None:
+    """Drop cached stats/alerts/list totals after an admin changes users, jobs or automations."""
+    with _dashboard_cache_lock:
+        _dashboard_cache.clear()
+    with _list_count_cache_lock:
+        _list_count_cache.clear()
+
+
+def _cached_count(query) -> int:
+    """COUNT(*) of query, cached briefly per (SQL, parameters)."""
+    query = query.order_by(None)
+    compiled = query.statement.compile()
+    key = (str(compiled), tuple(sorted(compiled.params.items())))
+    with _list_count_cache_lock:
+        total = _list_count_cache.get(key)
+    if total is None:
+        total = query.count()
+        with _list_count_cache_lock:
+            _list_count_cache[key] = total
+    return total
+
+
+def _paginate(query, created_col, id_col, skip, limit, before_id):
+    """
+    Apply newest-first ordering and a page window to an admin list query.
+
+    Returns (page_query, total) where total counts all rows matching the filters
+    (cached briefly, see _cached_count). When before_id (the last row of the previous
+    page) is given, the page continues after that row by (created_at, id) keyset
+    instead of scanning past skip rows; the two cannot be combined.
+    """
+    total_query = query
+    if before_id is not None:
+        if skip:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either skip or before_id, not both.",
+            )
+        cursor = query.session.execute(select(created_col).where(id_col == before_id)).first()
+        if cursor is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="before_id does not match any row.",
+            )
+        # Mirrors ORDER BY created_at DESC NULLS LAST, id DESC: rows without
+        # created_at come after every dated row. The cursor's created_at is compared
+        # in SQL (not re-bound from Python) so it matches the stored value exactly.
+        if cursor[0] is None:
+            query = query.filter(created_col.is_(None), id_col < before_id)
+        else:
+            cursor_created = select(created_col).where(id_col == before_id).scalar_subquery()
+            query = query.filter(
+                or_(
+                    tuple_(created_col, id_col) < tuple_(cursor_created, before_id),
+                    created_col.is_(None),
+                )
+            )
+    page = (
+        query.order_by(created_col.desc().nullslast(), id_col.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return page, _cached_count(total_query)
+
+
 def _audit_entry_to_admin(entry: AuditLog) -> AdminAuditEntry:
     """Map AuditLog ORM to AdminAuditEntry."""
     # Format time as ISO string for now; frontend can display directly
@@ -43,7 +208,7 @@ def _audit_entry_to_admin(entry: AuditLog) -> AdminAuditEntry:
         if entry.created_at is not None
         else ""
     )
-    return AdminAuditEntry(
+    return AdminAuditEntry.model_construct(
         id=entry.id,
         time=time_str,
         actor=entry.actor,
@@ -57,7 +222,7 @@ def _map_automation_to_admin_out(automation) -> AdminAutomationOut:
     user = automation.user
     user_name = (user.full_name or user.username or (user.email.split("@")[0] if user.email else "")) if user else ""
     user_email = user.email if user else ""
-    return AdminAutomationOut(
+    return AdminAutomationOut.model_construct(
         id=automation.id,
         user_id=automation.user_id,
         user_email=user_email,
@@ -75,7 +240,8 @@ def _map_automation_to_admin_out(automation) -> AdminAutomationOut:
     )
 
 
-def _map_user_to_admin_out(user: User) -> AdminUserOut:
+def _map_user_to_admin_out(user) -> AdminUserOut:
+    """Map a User (or a row from _ADMIN_USER_COLUMNS) to AdminUserOut."""
     name = user.full_name or user.username or user.email.split("@")[0]
     role = "admin" if user.is_superuser else "user"
     status_val = "active" if user.is_active else "suspended"
@@ -84,7 +250,7 @@ def _map_user_to_admin_out(user: User) -> AdminUserOut:
         if user.created_at is not None
         else ""
     )
-    return AdminUserOut(
+    return AdminUserOut.model_construct(
         id=user.id,
         name=name,
         email=user.email,
@@ -94,12 +260,13 @@ def _map_user_to_admin_out(user: User) -> AdminUserOut:
     )
 
 
-def _map_job_to_admin_out(job: Job) -> AdminJobOut:
+def _map_job_to_admin_out(job) -> AdminJobOut:
+    """Map a Job (or a row from _ADMIN_JOB_LIST_COLUMNS, which has no description) to AdminJobOut."""
     posted = job.created_at.date().isoformat() if job.created_at else ""
     status_val: str = job.status or "pending"
     if status_val not in ("pending", "approved", "rejected"):
         status_val = "pending"
-    return AdminJobOut(
+    return AdminJobOut.model_construct(
         id=job.id,
         title=job.title,
         company=job.company,
@@ -108,25 +275,29 @@ def _map_job_to_admin_out(job: Job) -> AdminJobOut:
         location=job.location,
         salary=job.salary_range,
         jobType=job.job_type,
-        description=job.description,
+        description=getattr(job, "description", None),
         jobUrl=job.job_url,
         source=job.source,
     )
 
 
-@router.get("/users", response_model=List[AdminUserOut])
-async def admin_list_users(
+@router.get("/users", responses={200: {"model": List[AdminUserOut]}})
+def admin_list_users(
     search: Optional[str] = Query(None, description="Search by name or email"),
     status: Optional[str] = Query(None, description="Filter by status: active|suspended"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    before_id: Optional[int] = Query(None, description="Keyset cursor: id of the last row of the previous page"),
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin),
 ):
     """
     List users for the admin panel with optional search and status filters.
+    The total number of matching users is returned in the X-Total-Count header.
     """
-    query = db.query(User)
+    query = db.query(*_ADMIN_USER_COLUMNS)
     if search:
-        s = f"%{search.lower()}%"
+        s = f"%{search}%"
         query = query.filter(
             (User.email.ilike(s))
             | (User.full_name.isnot(None) & User.full_name.ilike(s))
@@ -136,79 +307,99 @@ async def admin_list_users(
     elif status == "suspended":
         query = query.filter(User.is_active.is_(False))
 
-    users = query.order_by(User.created_at.desc().nullslast()).all()
-    return [_map_user_to_admin_out(u) for u in users]
+    page, total = _paginate(
+        query, User.created_at, User.id, skip, limit, before_id
+    )
+    return json_list_response(
+        [_map_user_to_admin_out(u) for u in page.all()],
+        headers={"X-Total-Count": str(total)},
+    )
 
 
 @router.post("/users/{user_id}/suspend", status_code=status.HTTP_204_NO_CONTENT)
-async def admin_suspend_user(
+def admin_suspend_user(
     user_id: int,
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin),
+    audit: AuditService = Depends(get_audit_service),
 ):
     """
     Suspend a user (set is_active = False).
     Admin cannot suspend themselves.
     """
-    if admin.id == user_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You cannot suspend your own admin account.",
-        )
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    # The self-check is part of the WHERE; only a miss needs to say which case it was.
+    updated = db.execute(
+        update(User)
+        .where(User.id == user_id, User.id != admin.id)
+        .values(is_active=False)
+        .returning(User.id)
+    ).first()
+    if not updated:
+        if admin.id == user_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You cannot suspend your own admin account.",
+            )
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
-    user.is_active = False
-    db.commit()
 
     # Audit
-    audit = AuditService(db)
     audit.log(
         actor=admin,
         action="user.suspended",
         target=f"User #{user_id}",
         ip="-",
     )
+    db.commit()
+    # A bulk UPDATE skips the mapper's after_update hook, so evict the cached user here.
+    invalidate_cached_user(user_id)
+    _invalidate_dashboard_cache()
 
 
 @router.post("/users/{user_id}/activate", status_code=status.HTTP_204_NO_CONTENT)
-async def admin_activate_user(
+def admin_activate_user(
     user_id: int,
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin),
+    audit: AuditService = Depends(get_audit_service),
 ):
     """
     Activate a user (set is_active = True).
     """
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    updated = db.execute(
+        update(User).where(User.id == user_id).values(is_active=True).returning(User.id)
+    ).first()
+    if not updated:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
-    user.is_active = True
-    db.commit()
 
     # Audit
-    audit = AuditService(db)
     audit.log(
         actor=admin,
         action="user.activated",
         target=f"User #{user_id}",
         ip="-",
     )
+    db.commit()
+    invalidate_cached_user(user_id)
+    _invalidate_dashboard_cache()
 
 
-@router.get("/jobs", response_model=List[AdminJobOut])
-async def admin_list_jobs(
+@router.get("/jobs", responses={200: {"model": List[AdminJobOut]}})
+def admin_list_jobs(
     search: Optional[str] = Query(None, description="Search by title or company"),
     status: Optional[str] = Query(None, description="Filter by status: pending|approved|rejected"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    before_id: Optional[int] = Query(None, description="Keyset cursor: id of the last row of the previous page"),
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin),
 ):
     """
-    List jobs for moderation in the admin panel.
+    List jobs for moderation in the admin panel (without descriptions; see GET /jobs/{job_id}).
+    The total number of matching jobs is returned in the X-Total-Count header.
     """
-    query = db.query(Job)
+    query = db.query(*_ADMIN_JOB_LIST_COLUMNS)
     if search:
-        s = f"%{search.lower()}%"
+        s = f"%{search}%"
         query = query.filter(
             (Job.title.ilike(s))
             | (Job.company.ilike(s))
@@ -216,52 +407,79 @@ async def admin_list_jobs(
     if status in ("pending", "approved", "rejected"):
         query = query.filter(Job.status == status)
 
-    jobs = query.order_by(Job.created_at.desc().nullslast()).all()
-    return [_map_job_to_admin_out(j) for j in jobs]
+    page, total = _paginate(
+        query, Job.created_at, Job.id, skip, limit, before_id
+    )
+    # Streamed from a server-side cursor; the session stays open until the response
+    # has been sent (get_db is torn down after the body).
+    return StreamingResponse(
+        stream_json_array(page.yield_per(STREAM_BATCH_SIZE), _map_job_to_admin_out),
+        media_type="application/json",
+        headers={"X-Total-Count": str(total)},
+    )
+
+
+@router.get("/jobs/{job_id}", responses={200: {"model": AdminJobOut}})
+def admin_get_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    admin=Depends(get_current_admin),
+):
+    """
+    Get a single job including its description.
+    """
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
+    return ORJSONResponse(_map_job_to_admin_out(job).model_dump(mode="json"))
 
 
 @router.post("/jobs", response_model=AdminJobOut, status_code=status.HTTP_201_CREATED)
-async def admin_create_job(
+def admin_create_job(
     payload: JobCreate,
     db: Session = Depends(get_db),
+    service: JobService = Depends(get_job_service),
     admin=Depends(get_current_admin),
+    audit: AuditService = Depends(get_audit_service),
 ):
     """
     Create a new job listing in the catalog.
     """
-    service = JobService(db)
-    job = service.create_job(payload)
+    # One commit for the job and its audit entry.
+    job = service.create_job(payload, commit=False)
 
     # Audit
-    audit = AuditService(db)
     audit.log(
         actor=admin,
         action="job.created",
         target=f"Job #{job.id}",
         ip="-",
     )
+    db.commit()
+    _invalidate_dashboard_cache()
 
     return _map_job_to_admin_out(job)
 
 
 @router.put("/jobs/{job_id}", response_model=AdminJobOut)
-async def admin_update_job(
+def admin_update_job(
     job_id: int,
     payload: JobCreate,
     db: Session = Depends(get_db),
+    service: JobService = Depends(get_job_service),
     admin=Depends(get_current_admin),
+    audit: AuditService = Depends(get_audit_service),
 ):
     """
     Update an existing job listing.
     """
-    service = JobService(db)
-    data = payload.model_dump(exclude_unset=True)
-    job = service.update_job(job_id, data)
+    # Set fields only, read straight off the model (declaration order keeps the audit text stable).
+    data = {k: getattr(payload, k) for k in JobCreate.model_fields if k in payload.model_fields_set}
+    job = service.update_job(job_id, data, commit=False)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
 
     # Audit
-    audit = AuditService(db)
     changed_fields = ", ".join(data.keys()) or "job"
     audit.log(
         actor=admin,
@@ -269,216 +487,224 @@ async def admin_update_job(
         target=f"Job #{job_id} ({changed_fields})",
         ip="-",
     )
+    db.commit()
+    _invalidate_dashboard_cache()
 
     return _map_job_to_admin_out(job)
 
 
 @router.delete("/jobs/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def admin_delete_job(
+def admin_delete_job(
     job_id: int,
     db: Session = Depends(get_db),
+    service: JobService = Depends(get_job_service),
     admin=Depends(get_current_admin),
+    audit: AuditService = Depends(get_audit_service),
 ):
     """
     Delete a job listing.
     """
-    service = JobService(db)
-    ok = service.delete_job(job_id)
+    ok = service.delete_job(job_id, commit=False)
     if not ok:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
 
     # Audit
-    audit = AuditService(db)
     audit.log(
         actor=admin,
         action="job.deleted",
         target=f"Job #{job_id}",
         ip="-",
     )
+    db.commit()
+    _invalidate_dashboard_cache()
 
 
 @router.post("/jobs/{job_id}/approve", status_code=status.HTTP_204_NO_CONTENT)
-async def admin_approve_job(
+def admin_approve_job(
     job_id: int,
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin),
+    audit: AuditService = Depends(get_audit_service),
 ):
     """
     Mark job as approved.
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
+    updated = db.execute(
+        update(Job).where(Job.id == job_id).values(status="approved").returning(Job.id)
+    ).first()
+    if not updated:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
-    job.status = "approved"
-    db.commit()
 
     # Audit
-    audit = AuditService(db)
     audit.log(
         actor=admin,
         action="job.approved",
         target=f"Job #{job_id}",
         ip="-",
     )
+    db.commit()
+    _invalidate_dashboard_cache()
 
 
 @router.post("/jobs/{job_id}/reject", status_code=status.HTTP_204_NO_CONTENT)
-async def admin_reject_job(
+def admin_reject_job(
     job_id: int,
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin),
+    audit: AuditService = Depends(get_audit_service),
 ):
     """
     Mark job as rejected.
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
+    updated = db.execute(
+        update(Job).where(Job.id == job_id).values(status="rejected").returning(Job.id)
+    ).first()
+    if not updated:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
-    job.status = "rejected"
-    db.commit()
 
     # Audit
-    audit = AuditService(db)
     audit.log(
         actor=admin,
         action="job.rejected",
         target=f"Job #{job_id}",
         ip="-",
     )
+    db.commit()
+    _invalidate_dashboard_cache()
 
 
 # —— Admin Automations ——
 
-@router.get("/automations", response_model=List[AdminAutomationOut])
-async def admin_list_automations(
+@router.get("/automations", responses={200: {"model": List[AdminAutomationOut]}})
+def admin_list_automations(
     search: Optional[str] = Query(None, description="Search by automation name or user email/name"),
-    db: Session = Depends(get_db),
+    service: AutomationService = Depends(get_automation_service),
     admin=Depends(get_current_admin),
 ):
     """
     List all automations across all users with user details.
     """
-    service = AutomationService(db)
     automations = service.list_all_for_admin(search=search)
-    return [_map_automation_to_admin_out(a) for a in automations]
+    return json_list_response([_map_automation_to_admin_out(a) for a in automations])
 
 
-@router.get("/automations/{automation_id}", response_model=AdminAutomationOut)
-async def admin_get_automation(
+@router.get("/automations/{automation_id}", responses={200: {"model": AdminAutomationOut}})
+def admin_get_automation(
     automation_id: int,
-    db: Session = Depends(get_db),
+    service: AutomationService = Depends(get_automation_service),
     admin=Depends(get_current_admin),
 ):
     """
     Get a single automation by id (any user).
     """
-    service = AutomationService(db)
     automation = service.get_automation_by_id(automation_id)
     if not automation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Automation not found.")
-    return _map_automation_to_admin_out(automation)
+    return ORJSONResponse(_map_automation_to_admin_out(automation).model_dump(mode="json"))
 
 
 @router.put("/automations/{automation_id}", response_model=AdminAutomationOut)
-async def admin_update_automation(
+def admin_update_automation(
     automation_id: int,
     payload: AutomationUpdate,
-    db: Session = Depends(get_db),
+    service: AutomationService = Depends(get_automation_service),
     admin=Depends(get_current_admin),
 ):
     """
     Update an automation (name, targets, daily limit, platforms, status, etc.).
     """
-    service = AutomationService(db)
     automation = service.update_automation_admin(automation_id, payload)
     if not automation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Automation not found.")
-    automation = service.get_automation_by_id(automation_id)
+    _invalidate_dashboard_cache()
     return _map_automation_to_admin_out(automation)
 
 
 @router.post("/automations/{automation_id}/pause", response_model=AdminAutomationOut)
-async def admin_pause_automation(
+def admin_pause_automation(
     automation_id: int,
     db: Session = Depends(get_db),
+    service: AutomationService = Depends(get_automation_service),
     admin=Depends(get_current_admin),
+    audit: AuditService = Depends(get_audit_service),
 ):
     """
     Pause an automation (any user).
     """
-    service = AutomationService(db)
-    automation = service.set_status_admin(automation_id, "paused")
+    automation = service.set_status_admin(automation_id, "paused", commit=False)
     if not automation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Automation not found.")
 
     # Audit
-    audit = AuditService(db)
     audit.log(
         actor=admin,
         action="automation.paused",
         target=f"Automation #{automation_id}",
         ip="-",
     )
+    db.commit()
+    _invalidate_dashboard_cache()
 
     return _map_automation_to_admin_out(automation)
 
 
 @router.post("/automations/{automation_id}/resume", response_model=AdminAutomationOut)
-async def admin_resume_automation(
+def admin_resume_automation(
     automation_id: int,
     db: Session = Depends(get_db),
+    service: AutomationService = Depends(get_automation_service),
     admin=Depends(get_current_admin),
+    audit: AuditService = Depends(get_audit_service),
 ):
     """
     Resume an automation (any user).
     """
-    service = AutomationService(db)
-    automation = service.set_status_admin(automation_id, "running")
+    automation = service.set_status_admin(automation_id, "running", commit=False)
     if not automation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Automation not found.")
 
     # Audit
-    audit = AuditService(db)
     audit.log(
         actor=admin,
         action="automation.resumed",
         target=f"Automation #{automation_id}",
         ip="-",
     )
+    db.commit()
+    _invalidate_dashboard_cache()
 
     return _map_automation_to_admin_out(automation)
 
 
 # —— Admin Site Settings ——
 
-@router.get("/settings", response_model=AdminSiteSettingsOut)
-async def admin_get_settings(
-    db: Session = Depends(get_db),
+@router.get("/settings", responses={200: {"model": AdminSiteSettingsOut}})
+def admin_get_settings(
+    service: SiteSettingsService = Depends(get_site_settings_service),
     admin=Depends(get_current_admin),
 ):
     """
     Get site-wide settings (maintenance mode, registration, limits, site name, support email).
     """
-    service = SiteSettingsService(db)
-    return service.get_settings()
+    return ORJSONResponse(service.get_settings().model_dump(mode="json"))
 
 
 @router.put("/settings", response_model=AdminSiteSettingsOut)
-async def admin_update_settings(
+def admin_update_settings(
     payload: AdminSiteSettingsUpdate,
     db: Session = Depends(get_db),
+    service: SiteSettingsService = Depends(get_site_settings_service),
     admin=Depends(get_current_admin),
+    audit: AuditService = Depends(get_audit_service),
 ):
     """
     Update site-wide settings.
     """
-    service = SiteSettingsService(db)
-    updated = service.update_settings(payload)
+    updated = service.update_settings(payload, commit=False)
 
     # Audit
-    audit = AuditService(db)
     changed_fields = ", ".join(
-        [k for k, v in payload.model_dump(exclude_unset=True).items()]
+        k for k in AdminSiteSettingsUpdate.model_fields if k in payload.model_fields_set
     ) or "settings"
     audit.log(
         actor=admin,
@@ -486,14 +712,16 @@ async def admin_update_settings(
         target=changed_fields,
         ip="-",
     )
+    db.commit()
+    invalidate_site_settings_cache()
     return updated
 
 
 # —— Admin dashboard (stats, activity, alerts, audit) ——
 
 
-@router.get("/stats", response_model=List[AdminStatCard])
-async def admin_dashboard_stats(
+@router.get("/stats", responses={200: {"model": List[AdminStatCard]}})
+def admin_dashboard_stats(
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin),
 ):
@@ -503,163 +731,135 @@ async def admin_dashboard_stats(
     - active jobs (approved)
     - running automations
     - applications in last 30 days
+
+    Cached for ADMIN_DASHBOARD_CACHE_TTL_SECONDS.
     """
-    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+    cached = _get_cached_dashboard("stats")
+    if cached is not None:
+        return cached
 
-    total_users = db.query(User).count()
-    active_jobs = db.query(Job).filter(Job.status == "approved").count()
-    running_automations = (
-        db.query(Automation).filter(Automation.status == "running").count()
-    )
-    applications_30d = (
-        db.query(UserJob)
-        .filter(UserJob.applied_at.isnot(None), UserJob.applied_at >= thirty_days_ago)
-        .count()
-    )
+    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
 
-    return [
-        AdminStatCard(
-            label="Total users",
-            value=f"{total_users:,}",
-            change="+0 this month",
-            key="users",
-        ),
-        AdminStatCard(
-            label="Active jobs",
-            value=f"{active_jobs:,}",
-            change="Approved listings",
-            key="jobs",
-        ),
-        AdminStatCard(
-            label="Automations",
-            value=f"{running_automations:,}",
-            change="Running",
-            key="automations",
-        ),
-        AdminStatCard(
-            label="Applications (30d)",
-            value=f"{applications_30d:,}",
-            change="Last 30 days",
-            key="applications",
-        ),
-    ]
+    def _counter(key: str):
+        return select(AdminCounter.value).where(AdminCounter.key == key).scalar_subquery()
+
+    # One round trip. Totals come from trigger-maintained admin_counters when the row
+    # exists; COALESCE only evaluates the live COUNT when it does not (e.g. non-Postgres).
+    counts = db.execute(
+        select(
+            func.coalesce(
+                _counter("users"),
+                select(func.count()).select_from(User).scalar_subquery(),
+            ).label("users"),
+            func.coalesce(
+                _counter("active_jobs"),
+                select(func.count())
+                .select_from(Job)
+                .where(Job.status == "approved")
+                .scalar_subquery(),
+            ).label("jobs"),
+            func.coalesce(
+                _counter("running_automations"),
+                select(func.count())
+                .select_from(Automation)
+                .where(Automation.status == "running")
+                .scalar_subquery(),
+            ).label("automations"),
+            select(func.count())
+            .select_from(UserJob)
+            .where(UserJob.applied_at.isnot(None), UserJob.applied_at >= thirty_days_ago)
+            .scalar_subquery()
+            .label("applications"),
+        )
+    ).one()
+    values = (counts.users, counts.jobs, counts.automations, counts.applications)
+    return _cache_dashboard("stats", [
+        card.model_copy(update={"value": _fmt_count(n)})
+        for card, n in zip(_STAT_CARD_TEMPLATES, values)
+    ])
 
 
-@router.get("/activity", response_model=List[AdminActivityItem])
-async def admin_dashboard_activity(
+@router.get("/activity", responses={200: {"model": List[AdminActivityItem]}})
+def admin_dashboard_activity(
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin),
 ):
     """
     Recent mixed activity: new users, jobs, automations, and applications.
     """
-    tz = timezone.utc
-    now = datetime.now(tz)
-
-    def _rel(dt: datetime | None) -> str:
-        if not dt:
-            return ""
-        if dt.tzinfo is None:
-            dt_local = dt.replace(tzinfo=tz)
-        else:
-            dt_local = dt
-        delta = now - dt_local
-        if delta < timedelta(minutes=1):
-            return "Just now"
-        if delta < timedelta(hours=1):
-            m = int(delta.total_seconds() / 60)
-            return f"{m} min ago"
-        if delta < timedelta(days=1):
-            h = int(delta.total_seconds() / 3600)
-            return f"{h} hr ago"
-        if delta < timedelta(days=7):
-            d = delta.days
-            return f"{d} day{'s' if d != 1 else ''} ago"
-        return dt_local.strftime("%b %d")
+    now_ts = datetime.now(timezone.utc).timestamp()
+
+    # One UNION ALL over the four sources, each branch already limited and ordered by
+    # its own timestamp; the database merges them by real time and keeps the newest 30.
+    def _branch(kind: str, id_col, ts_col, status_col, text_a, text_b):
+        return select(
+            literal(kind, String).label("kind"),
+            id_col.label("id"),
+            ts_col.label("ts"),
+            status_col.label("status"),
+            text_a.label("text_a"),
+            text_b.label("text_b"),
+        ).order_by(ts_col.desc().nullslast()).limit(_ACTIVITY_LIMIT).subquery()
+
+    no_text = null().cast(String)
+    branches = [
+        _branch("user", User.id, User.created_at, no_text, User.email, no_text),
+        _branch("job", Job.id, Job.created_at, Job.status, Job.title, Job.company),
+        _branch("automation", Automation.id, Automation.created_at, Automation.status, Automation.name, no_text),
+        _branch(
+            "application",
+            UserJob.id,
+            UserJob.applied_at,
+            no_text,
+            cast(UserJob.user_id, String),
+            cast(UserJob.job_id, String),
+        ),
+    ]
+    activity = union_all(*(select(*b.c) for b in branches)).subquery()
+    rows = db.execute(
+        select(activity)
+        .order_by(activity.c.ts.desc().nullslast())
+        .limit(_ACTIVITY_LIMIT)
+    ).all()
 
     items: List[AdminActivityItem] = []
-
-    recent_users = (
-        db.query(User)
-        .order_by(User.created_at.desc().nullslast())
-        .limit(10)
-        .all()
-    )
-    for u in recent_users:
-        items.append(
-            AdminActivityItem(
-                id=f"user-{u.id}",
-                time=_rel(u.created_at),
-                action="New user registered" if u.created_at else "User activity",
-                detail=u.email,
-                type="user",
-            )
-        )
-
-    recent_jobs = (
-        db.query(Job)
-        .order_by(Job.created_at.desc().nullslast())
-        .limit(10)
-        .all()
-    )
-    for j in recent_jobs:
-        items.append(
-            AdminActivityItem(
-                id=f"job-{j.id}",
-                time=_rel(j.created_at),
-                action=f"Job {j.status or 'pending'}",
-                detail=f"{j.title} @ {j.company}",
-                type="job",
-            )
-        )
-
-    recent_automations = (
-        db.query(Automation)
-        .order_by(Automation.created_at.desc().nullslast())
-        .limit(10)
-        .all()
-    )
-    for a in recent_automations:
-        items.append(
-            AdminActivityItem(
-                id=f"automation-{a.id}",
-                time=_rel(a.created_at),
-                action=f"Automation {a.status or 'created'}",
-                detail=a.name or "Automation",
-                type="automation",
-            )
-        )
-
-    recent_apps = (
-        db.query(UserJob)
-        .order_by(UserJob.applied_at.desc().nullslast())
-        .limit(10)
-        .all()
-    )
-    for uj in recent_apps:
+    for row in rows:
+        if row.kind == "user":
+            action = "New user registered" if row.ts else "User activity"
+            detail = row.text_a
+        elif row.kind == "job":
+            action = f"Job {row.status or 'pending'}"
+            detail = f"{row.text_a} @ {row.text_b}"
+        elif row.kind == "automation":
+            action = f"Automation {row.status or 'created'}"
+            detail = row.text_a or "Automation"
+        else:
+            action = "Application submitted"
+            detail = f"user_id={row.text_a}, job_id={row.text_b}"
         items.append(
-            AdminActivityItem(
-                id=f"app-{uj.id}",
-                time=_rel(uj.applied_at),
-                action="Application submitted",
-                detail=f"user_id={uj.user_id}, job_id={uj.job_id}",
-                type="application",
+            AdminActivityItem.model_construct(
+                id=f"{'app' if row.kind == 'application' else row.kind}-{row.id}",
+                time=_rel(row.ts, now_ts),
+                action=action,
+                detail=detail,
+                type=row.kind,
             )
         )
+    return json_list_response(items)
 
-    # Sort all by time descending (approximate: use created/applied dates already roughly ordered)
-    items.sort(key=lambda i: i.time, reverse=True)
-    return items[:30]
 
-
-@router.get("/alerts", response_model=List[AdminAlert])
-async def admin_dashboard_alerts(
+@router.get("/alerts", responses={200: {"model": List[AdminAlert]}})
+def admin_dashboard_alerts(
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin),
 ):
     """
-    High-level alerts for admin dashboard.
+    High-level alerts for admin dashboard. Cached for ADMIN_DASHBOARD_CACHE_TTL_SECONDS.
     """
+    cached = _get_cached_dashboard("alerts")
+    if cached is not None:
+        return cached
+
     pending_jobs = db.query(Job).filter(Job.status == "pending").count()
     suspended_users = db.query(User).filter(User.is_active.is_(False)).count()
 
@@ -683,29 +883,28 @@ async def admin_dashboard_alerts(
             )
         )
 
-    return alerts
+    return _cache_dashboard("alerts", alerts)
 
 
-@router.get("/audit", response_model=List[AdminAuditEntry])
-async def admin_audit_log(
+@router.get("/audit", responses={200: {"model": List[AdminAuditEntry]}})
+def admin_audit_log(
     search: Optional[str] = Query(
         None, description="Search by actor, action, or target"
     ),
     action: Optional[str] = Query(None, description="Filter by action code"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    db: Session = Depends(get_db),
     admin=Depends(get_current_admin),
+    audit: AuditService = Depends(get_audit_service),
 ):
     """
     List audit log entries for admin UI.
     """
-    service = AuditService(db)
-    entries = service.list_entries(
+    entries = audit.list_entries(
         search=search,
         action_filter=action,
         skip=skip,
         limit=limit,
     )
-    return [_audit_entry_to_admin(e) for e in entries]
+    return json_list_response([_audit_entry_to_admin(e) for e in entries])
 
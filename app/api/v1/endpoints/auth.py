@@ -2,11 +2,11 @@
 Authentication endpoints.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.schemas.auth import Token, UserCreate, UserResponse, UserInfo
+from app.api.dependencies import get_auth_service, limit_login_attempts, limit_signup_attempts
+from app.schemas.auth import Token, UserCreate, UserResponse
 from app.schemas.company import CompanyRegister
 from app.services.auth_service import AuthService
 
@@ -14,47 +14,62 @@ router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
-def _user_info(user):
-    role = getattr(user, "role", None) or "user"
-    return UserInfo(
-        id=user.id,
-        email=user.email,
-        full_name=user.full_name,
-        role=role,
-        is_superuser=user.is_superuser or False,
+def _user_info(user, role: str | None = None) -> dict:
+    """UserInfo fields for the token response, as a plain dict (role overrides the stored one)."""
+    return {
+        "id": user.id,
+        "email": user.email,
+        "full_name": user.full_name,
+        "role": role or user.role or "user",
+        "is_superuser": bool(user.is_superuser),
+    }
+
+
+def _token_response(access_token: str, user_info: dict, status_code: int = 200) -> ORJSONResponse:
+    """Token payload written straight to JSON; its shape is documented by the Token schema."""
+    return ORJSONResponse(
+        {"access_token": access_token, "token_type": "bearer", "user": user_info},
+        status_code=status_code,
     )
 
 
-@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user: UserCreate, db: Session = Depends(get_db)):
+@router.post(
+    "/register",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(limit_signup_attempts)],
+)
+def register(user: UserCreate, auth_service: AuthService = Depends(get_auth_service)):
     """Register a new user (job seeker)."""
-    auth_service = AuthService(db)
     return auth_service.create_user(user)
 
 
-@router.post("/register/company", response_model=Token, status_code=status.HTTP_201_CREATED)
-async def register_company(payload: CompanyRegister, db: Session = Depends(get_db)):
+@router.post(
+    "/register/company",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": Token}},
+    dependencies=[Depends(limit_signup_attempts)],
+)
+def register_company(payload: CompanyRegister, auth_service: AuthService = Depends(get_auth_service)):
     """Register a new company (employer) account and log in."""
-    auth_service = AuthService(db)
     try:
         user = auth_service.create_company_user(payload)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     access_token = auth_service.create_access_token(data={"sub": user.email})
-    return Token(
-        access_token=access_token,
-        token_type="bearer",
-        user=_user_info(user),
-    )
+    return _token_response(access_token, _user_info(user), status_code=status.HTTP_201_CREATED)
 
 
-@router.post("/login", response_model=Token)
-async def login(
+@router.post(
+    "/login",
+    responses={200: {"model": Token}},
+    dependencies=[Depends(limit_login_attempts)],
+)
+def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """Login and get access token; returns user info for redirect by role."""
-    auth_service = AuthService(db)
     user = auth_service.authenticate_user(form_data.username, form_data.password)
     if not user:
         raise HTTPException(
@@ -63,17 +78,17 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
     access_token = auth_service.create_access_token(data={"sub": user.email})
-    return Token(
-        access_token=access_token,
-        token_type="bearer",
-        user=_user_info(user),
-    )
+    return _token_response(access_token, _user_info(user))
 
 
-@router.post("/admin-login", response_model=Token)
-async def admin_login(
+@router.post(
+    "/admin-login",
+    responses={200: {"model": Token}},
+    dependencies=[Depends(limit_login_attempts)],
+)
+def admin_login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """
     Admin-only login endpoint.
@@ -81,7 +96,6 @@ async def admin_login(
     Accepts the same form fields as /auth/login but only allows users with
     is_superuser=True to obtain a token.
     """
-    auth_service = AuthService(db)
     user = auth_service.authenticate_user(form_data.username, form_data.password)
     if not user:
         raise HTTPException(
@@ -95,15 +109,6 @@ async def admin_login(
             detail="Admin credentials required.",
         )
     access_token = auth_service.create_access_token(data={"sub": user.email})
-    return Token(
-        access_token=access_token,
-        token_type="bearer",
-        user=UserInfo(
-            id=user.id,
-            email=user.email,
-            full_name=user.full_name,
-            role="user",
-            is_superuser=True,
-        ),
-    )
+    # Admins always sign in to the admin UI under the plain user role.
+    return _token_response(access_token, _user_info(user, role="user"))
 
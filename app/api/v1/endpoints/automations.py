@@ -4,70 +4,46 @@ Automation endpoints: create/list and pause/resume user auto-apply rules.
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_automation_service, get_current_user, get_site_settings_service, get_user_job_service
 from app.schemas.automation import (
     AutomationCreate,
     AutomationResponse,
     AutomationRunResultResponse,
 )
 from app.schemas.user_job import UserJobResponseWithJob
-from app.schemas.job import JobResponse
 from app.services.automation_service import AutomationService
 from app.services.user_job_service import UserJobService
 from app.services.site_settings_service import SiteSettingsService
+from app.utils.streaming import json_list_response
 
 router = APIRouter()
 
 
 def _automation_response(automation, applications_today: int) -> AutomationResponse:
     """Build AutomationResponse with applications_today set."""
-    resp = AutomationResponse.model_validate(automation)
-    return resp.model_copy(update={"applications_today": applications_today})
-
-
-def _user_job_with_job(uj):
-    """Build UserJobResponseWithJob from UserJob ORM (job relationship loaded)."""
-    return UserJobResponseWithJob(
-        id=uj.id,
-        user_id=uj.user_id,
-        job_id=uj.job_id,
-        automation_id=getattr(uj, "automation_id", None),
-        status=uj.status,
-        notes=uj.notes,
-        resume_path=uj.resume_path,
-        cover_letter_path=uj.cover_letter_path,
-        applied_at=uj.applied_at,
-        created_at=uj.created_at,
-        updated_at=uj.updated_at,
-        job=JobResponse.model_validate(uj.job),
-    )
+    resp = AutomationResponse.from_orm_trusted(automation)
+    resp.applications_today = applications_today
+    return resp
 
 
-@router.get("/", response_model=List[AutomationResponse])
-async def list_my_automations(
-    db: Session = Depends(get_db),
+@router.get("/", responses={200: {"model": List[AutomationResponse]}})
+def list_my_automations(
+    service: AutomationService = Depends(get_automation_service),
     current_user=Depends(get_current_user),
 ):
     """Return all automations for the authenticated user (with applications_today)."""
-    service = AutomationService(db)
-    automations = service.list_automations_for_user(current_user.id)
-    return [
-        _automation_response(a, service.get_applications_today_count(a.id))
-        for a in automations
-    ]
+    rows = service.list_automations_with_applications_today(current_user.id)
+    return json_list_response([_automation_response(a, n) for a, n in rows])
 
 
 @router.get("/{automation_id}", response_model=AutomationResponse)
-async def get_automation(
+def get_automation(
     automation_id: int,
-    db: Session = Depends(get_db),
+    service: AutomationService = Depends(get_automation_service),
     current_user=Depends(get_current_user),
 ):
     """Get a single automation by id (must belong to current user)."""
-    service = AutomationService(db)
     automation = service.get_automation_for_user(automation_id, current_user.id)
     if not automation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Automation not found")
@@ -81,9 +57,10 @@ async def get_automation(
     response_model=AutomationResponse,
     status_code=status.HTTP_201_CREATED,
 )
-async def create_automation(
+def create_automation(
     payload: AutomationCreate,
-    db: Session = Depends(get_db),
+    automation_service: AutomationService = Depends(get_automation_service),
+    settings_service: SiteSettingsService = Depends(get_site_settings_service),
     current_user=Depends(get_current_user),
 ):
     """
@@ -92,36 +69,32 @@ async def create_automation(
 
     New automations start in a paused state; the user must explicitly resume them.
     """
-    automation_service = AutomationService(db)
-    settings_service = SiteSettingsService(db)
-    settings = settings_service.get_settings()
-    max_automations = getattr(settings, "max_automations_per_user", 10) or 10
-    count = automation_service.count_automations_for_user(current_user.id)
-    if count >= max_automations:
+    max_automations = settings_service.get_max_automations_per_user()
+    automation = automation_service.create_automation(
+        current_user.id, payload, max_automations=max_automations
+    )
+    if automation is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Maximum automations ({max_automations}) reached. Delete an existing automation to create a new one.",
         )
-    automation = automation_service.create_automation(current_user.id, payload)
-    return _automation_response(
-        automation, automation_service.get_applications_today_count(automation.id)
-    )
+    # A brand-new automation has not applied to anything yet.
+    return _automation_response(automation, 0)
 
 
 @router.post(
     "/{automation_id}/run",
     response_model=AutomationRunResultResponse,
 )
-async def run_automation(
+def run_automation(
     automation_id: int,
-    db: Session = Depends(get_db),
+    service: AutomationService = Depends(get_automation_service),
     current_user=Depends(get_current_user),
 ):
     """
     Run automation once: find matching jobs (by target titles/locations),
     apply up to daily limit. Returns applied count and message for toast.
     """
-    service = AutomationService(db)
     result = service.run_automation(automation_id, current_user.id)
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Automation not found")
@@ -134,13 +107,12 @@ async def run_automation(
 
 
 @router.post("/{automation_id}/pause", response_model=AutomationResponse)
-async def pause_automation(
+def pause_automation(
     automation_id: int,
-    db: Session = Depends(get_db),
+    service: AutomationService = Depends(get_automation_service),
     current_user=Depends(get_current_user),
 ):
     """Pause a running automation."""
-    service = AutomationService(db)
     automation = service.set_status(automation_id, current_user.id, "paused")
     if not automation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Automation not found")
@@ -150,13 +122,12 @@ async def pause_automation(
 
 
 @router.post("/{automation_id}/resume", response_model=AutomationResponse)
-async def resume_automation(
+def resume_automation(
     automation_id: int,
-    db: Session = Depends(get_db),
+    service: AutomationService = Depends(get_automation_service),
     current_user=Depends(get_current_user),
 ):
     """Resume a paused automation."""
-    service = AutomationService(db)
     automation = service.set_status(automation_id, current_user.id, "running")
     if not automation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Automation not found")
@@ -165,22 +136,22 @@ async def resume_automation(
     )
 
 
-@router.get("/{automation_id}/jobs", response_model=List[UserJobResponseWithJob])
-async def list_automation_jobs(
+@router.get("/{automation_id}/jobs", responses={200: {"model": List[UserJobResponseWithJob]}})
+def list_automation_jobs(
     automation_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
-    db: Session = Depends(get_db),
+    automation_service: AutomationService = Depends(get_automation_service),
+    user_job_service: UserJobService = Depends(get_user_job_service),
     current_user=Depends(get_current_user),
 ):
     """List jobs applied (or saved) for this automation. Automation must belong to current user."""
-    automation_service = AutomationService(db)
     automation = automation_service.get_automation_for_user(automation_id, current_user.id)
     if not automation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Automation not found")
-    user_job_service = UserJobService(db)
     user_jobs = user_job_service.get_user_jobs_for_automation(
         current_user.id, automation_id, skip=skip, limit=limit
     )
-    return [_user_job_with_job(uj) for uj in user_jobs]
+    items = [UserJobResponseWithJob.from_orm_trusted(uj) for uj in user_jobs]
+    return json_list_response(items)
 
@@ -1,15 +1,17 @@
 """
 Company (employer) endpoints: profile, jobs, applicants, approve/reject, view resume.
 """
+import asyncio
+import os
 from pathlib import Path
-from typing import List
+from typing import List, Set
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 from app.core.database import get_db
-from app.api.dependencies import get_current_company
+from app.api.dependencies import get_company_service, get_current_company, get_user_setup_service
 from app.models.company import Company
 from app.models.user_job import UserJobStatus
 from app.schemas.company import (
@@ -22,12 +24,17 @@ from app.schemas.company import (
 from app.schemas.job import JobCreate, JobResponse
 from app.services.company_service import CompanyService
 from app.services.user_setup_service import UserSetupService
+from app.utils.files import cached_file_response
+from app.utils.streaming import STREAM_BATCH_SIZE, json_list_response, stream_json_array
 
 router = APIRouter()
 
+# Lower-cased status value -> enum member, for parsing PATCH payloads without try/except.
+_APPLICATION_STATUSES = {s.value: s for s in UserJobStatus}
+
 
 @router.get("/profile", response_model=CompanyResponse)
-async def get_company_profile(
+def get_company_profile(
     company: Company = Depends(get_current_company),
 ):
     """Get current company profile."""
@@ -35,7 +42,7 @@ async def get_company_profile(
 
 
 @router.put("/profile", response_model=CompanyResponse)
-async def update_company_profile(
+def update_company_profile(
     payload: CompanyUpdate,
     db=Depends(get_db),
     company: Company = Depends(get_current_company),
@@ -50,35 +57,36 @@ async def update_company_profile(
 
 
 @router.get("/stats", response_model=CompanyStats)
-async def get_company_stats(
+def get_company_stats(
     company: Company = Depends(get_current_company),
-    db: Session = Depends(get_db),
+    service: CompanyService = Depends(get_company_service),
 ):
     """Get dashboard stats: total jobs and total applicants."""
-    service = CompanyService(db)
     stats = service.get_stats(company.id)
     return CompanyStats(**stats)
 
 
-@router.get("/jobs", response_model=List[JobResponse])
-async def list_company_jobs(
+@router.get("/jobs", responses={200: {"model": List[JobResponse]}})
+def list_company_jobs(
     company: Company = Depends(get_current_company),
-    db=Depends(get_db),
+    service: CompanyService = Depends(get_company_service),
 ):
     """List jobs posted by this company."""
-    service = CompanyService(db)
-    jobs = service.list_jobs_for_company(company.id)
-    return jobs
+    jobs = service.list_jobs_for_company(company.id, batch_size=STREAM_BATCH_SIZE)
+    # The session stays open until the body has been sent (get_db is torn down after it).
+    return StreamingResponse(
+        stream_json_array(jobs, JobResponse.from_orm_trusted),
+        media_type="application/json",
+    )
 
 
 @router.post("/jobs", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
-async def create_company_job(
+def create_company_job(
     payload: JobCreate,
     company: Company = Depends(get_current_company),
-    db=Depends(get_db),
+    service: CompanyService = Depends(get_company_service),
 ):
     """Create a job listing (owned by this company)."""
-    service = CompanyService(db)
     job = service.create_job_for_company(
         company.id,
         company.company_name,
@@ -88,75 +96,80 @@ async def create_company_job(
 
 
 @router.get("/jobs/{job_id}", response_model=JobResponse)
-async def get_company_job(
+def get_company_job(
     job_id: int,
     company: Company = Depends(get_current_company),
-    db=Depends(get_db),
+    service: CompanyService = Depends(get_company_service),
 ):
     """Get a single job owned by this company."""
-    service = CompanyService(db)
     job = service.get_job_for_company(job_id, company.id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
     return job
 
 
-def _applicant_has_resume(uj) -> bool:
-    """True if this applicant has a resume we can show (user_job.resume_path or user_setup)."""
-    if uj.resume_path and Path(uj.resume_path).exists():
-        return True
-    if uj.user and getattr(uj.user, "user_setup", None):
-        setup = uj.user.user_setup
-        if setup and setup.resume_file_path and Path(setup.resume_file_path).exists():
-            return True
-    return False
+def _resume_candidates(uj) -> List[str]:
+    """Resume paths that may back this applicant (user_job.resume_path, then user_setup)."""
+    paths = []
+    if uj.resume_path:
+        paths.append(uj.resume_path)
+    setup = uj.user.user_setup if uj.user else None
+    if setup and setup.resume_file_path:
+        paths.append(setup.resume_file_path)
+    return paths
+
+
+async def _existing_paths(paths) -> Set[str]:
+    """Stat each distinct path concurrently in worker threads; return the ones that exist."""
+    unique = list(dict.fromkeys(paths))
+    found = await asyncio.gather(*(asyncio.to_thread(os.path.exists, p) for p in unique))
+    return {p for p, exists in zip(unique, found) if exists}
 
 
-@router.get("/jobs/{job_id}/applicants", response_model=List[ApplicantSummary])
+@router.get("/jobs/{job_id}/applicants", responses={200: {"model": List[ApplicantSummary]}})
 async def list_job_applicants(
     job_id: int,
     company: Company = Depends(get_current_company),
-    db: Session = Depends(get_db),
+    service: CompanyService = Depends(get_company_service),
 ):
     """List users who applied to this job (user_jobs for this job)."""
-    service = CompanyService(db)
-    user_jobs = service.get_applicants_for_job(job_id, company.id)
+    user_jobs = await run_in_threadpool(service.get_applicants_for_job, job_id, company.id)
+    candidates = {uj.id: _resume_candidates(uj) for uj in user_jobs}
+    existing = await _existing_paths(p for paths in candidates.values() for p in paths)
     out = []
     for uj in user_jobs:
         u = uj.user
         name = (u.full_name or u.username or (u.email.split("@")[0] if u.email else "")) if u else ""
         out.append(
-            ApplicantSummary(
+            ApplicantSummary.model_construct(
                 id=uj.id,
                 user_id=uj.user_id,
                 user_email=u.email if u else "",
                 user_name=name,
-                status=uj.status.value if hasattr(uj.status, "value") else str(uj.status),
+                status=uj.status,
                 applied_at=uj.applied_at,
                 created_at=uj.created_at,
-                has_resume=_applicant_has_resume(uj),
+                has_resume=any(p in existing for p in candidates[uj.id]),
             )
         )
-    return out
+    return json_list_response(out)
 
 
 @router.patch("/jobs/{job_id}/applicants/{applicant_id}")
-async def update_application_status(
+def update_application_status(
     job_id: int,
     applicant_id: int,
     payload: ApplicationStatusUpdate,
     company: Company = Depends(get_current_company),
-    db: Session = Depends(get_db),
+    service: CompanyService = Depends(get_company_service),
 ):
     """Approve, reject, or update status of an application (reviewing, interview, accepted, rejected)."""
-    try:
-        new_status = UserJobStatus(payload.status.lower())
-    except ValueError:
+    new_status = _APPLICATION_STATUSES.get(payload.status.lower())
+    if new_status is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid status. Use: reviewing, interview, accepted, rejected",
         )
-    service = CompanyService(db)
     uj = service.update_application_status(job_id, applicant_id, company.id, new_status)
     if not uj:
         raise HTTPException(
@@ -165,8 +178,8 @@ async def update_application_status(
         )
     return {
         "id": uj.id,
-        "status": uj.status.value,
-        "message": f"Application {uj.status.value}.",
+        "status": uj.status,
+        "message": f"Application {uj.status}.",
     }
 
 
@@ -181,15 +194,15 @@ def _get_applicant_resume_path(uj, setup_service: UserSetupService):
 
 
 @router.get("/jobs/{job_id}/applicants/{applicant_id}/resume")
-async def get_applicant_resume(
+def get_applicant_resume(
+    request: Request,
     job_id: int,
     applicant_id: int,
     company: Company = Depends(get_current_company),
-    db: Session = Depends(get_db),
+    service: CompanyService = Depends(get_company_service),
+    setup_service: UserSetupService = Depends(get_user_setup_service),
 ):
     """Download an applicant's resume (PDF/doc). Only for jobs owned by this company."""
-    service = CompanyService(db)
-    setup_service = UserSetupService(db)
     uj = service.get_applicant_user_job(job_id, applicant_id, company.id)
     if not uj:
         raise HTTPException(
@@ -203,13 +216,4 @@ async def get_applicant_resume(
             detail="No resume available for this applicant.",
         )
     original_name, path = result
-    media_type = (
-        "application/pdf"
-        if (original_name or "").lower().endswith(".pdf")
-        else "application/octet-stream"
-    )
-    return FileResponse(
-        path=str(path),
-        filename=original_name,
-        media_type=media_type,
-    )
+    return cached_file_response(request, path, original_name)
@@ -2,13 +2,14 @@
 User dashboard endpoints: stats, campaigns (automations), activity, pause/resume.
 """
 
-from typing import List
+from threading import Lock
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from app.core.database import get_db
-from app.api.dependencies import get_current_user
+from app.core.config import settings
+from app.api.dependencies import get_automation_service, get_current_user, get_dashboard_service
 from app.models.user import User
 from app.schemas.dashboard import (
     DashboardStat,
@@ -17,153 +18,103 @@ from app.schemas.dashboard import (
 )
 from app.services.dashboard_service import DashboardService
 from app.services.automation_service import AutomationService
+from app.utils.streaming import dump_json_list
 
 router = APIRouter()
 
-
-@router.get("/stats", response_model=List[DashboardStat])
-async def get_dashboard_stats(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    """Dashboard stat cards for the authenticated user."""
-    service = DashboardService(db)
-    return service.get_stats(current_user.id)
-
-
-@router.get("/campaigns", response_model=List[DashboardCampaign])
-async def get_dashboard_campaigns(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    """Active campaigns (automations) for the authenticated user."""
-    service = DashboardService(db)
-    return service.get_campaigns(current_user.id)
-
-
-@router.get("/activity", response_model=List[DashboardActivityItem])
-async def get_dashboard_activity(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    """Recent activity (applications, interviews) for the authenticated user."""
-    service = DashboardService(db)
-    return service.get_activity(current_user.id)
-
-
-@router.post("/campaigns/{campaign_id}/pause")
-async def pause_campaign(
-    campaign_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    """Pause an automation (campaign)."""
-    automation_service = AutomationService(db)
-    automation = automation_service.set_status(campaign_id, current_user.id, "paused")
-    if not automation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Campaign not found",
-        )
-    return {"status": "paused", "id": automation.id}
+# Rendered JSON bodies keyed by (endpoint, user_id); dashboards are reloaded often.
+_dashboard_cache: TTLCache = TTLCache(maxsize=10_000, ttl=settings.USER_DASHBOARD_CACHE_TTL_SECONDS)
+_dashboard_cache_lock = Lock()
+_DASHBOARD_PARTS = ("stats", "campaigns", "activity")
 
 
-@router.post("/campaigns/{campaign_id}/resume")
-async def resume_campaign(
-    campaign_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    """Resume an automation (campaign)."""
-    automation_service = AutomationService(db)
-    automation = automation_service.set_status(campaign_id, current_user.id, "running")
-    if not automation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Campaign not found",
-        )
-    return {"status": "running", "id": automation.id}
+def _get_cached_dashboard(part: str, user_id: int) -> Optional[Response]:
+    """Return the cached response for one dashboard endpoint, or None on a miss."""
+    with _dashboard_cache_lock:
+        body = _dashboard_cache.get((part, user_id))
+    return Response(content=body, media_type="application/json") if body is not None else None
 
-"""
-User dashboard endpoints: stats, campaigns (automations), activity, pause/resume.
-"""
-from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+def _cache_dashboard(part: str, user_id: int, items: list) -> Response:
+    """Render items to JSON once, cache the bytes and return them."""
+    body = dump_json_list(items)
+    with _dashboard_cache_lock:
+        _dashboard_cache[(part, user_id)] = body
+    return Response(content=body, media_type="application/json")
 
-from app.core.database import get_db
-from app.api.dependencies import get_current_user
-from app.models.user import User
-from app.schemas.dashboard import (
-    DashboardStat,
-    DashboardCampaign,
-    DashboardActivityItem,
-)
-from app.services.dashboard_service import DashboardService
-from app.services.automation_service import AutomationService
 
-router = APIRouter()
+def _invalidate_dashboard_cache(user_id: int) -> None:
+    """Drop the user's cached dashboard after they change a campaign."""
+    with _dashboard_cache_lock:
+        for part in _DASHBOARD_PARTS:
+            _dashboard_cache.pop((part, user_id), None)
 
 
-@router.get("/stats", response_model=List[DashboardStat])
-async def get_dashboard_stats(
+@router.get("/stats", responses={200: {"model": List[DashboardStat]}})
+def get_dashboard_stats(
     current_user: User = Depends(get_current_user),
-    db=Depends(get_db),
+    service: DashboardService = Depends(get_dashboard_service),
 ):
     """Dashboard stat cards for the authenticated user."""
-    service = DashboardService(db)
-    return service.get_stats(current_user.id)
+    cached = _get_cached_dashboard("stats", current_user.id)
+    if cached is not None:
+        return cached
+    return _cache_dashboard("stats", current_user.id, service.get_stats(current_user.id))
 
 
-@router.get("/campaigns", response_model=List[DashboardCampaign])
-async def get_dashboard_campaigns(
+@router.get("/campaigns", responses={200: {"model": List[DashboardCampaign]}})
+def get_dashboard_campaigns(
     current_user: User = Depends(get_current_user),
-    db=Depends(get_db),
+    service: DashboardService = Depends(get_dashboard_service),
 ):
     """Active campaigns (automations) for the authenticated user."""
-    service = DashboardService(db)
-    return service.get_campaigns(current_user.id)
+    cached = _get_cached_dashboard("campaigns", current_user.id)
+    if cached is not None:
+        return cached
+    return _cache_dashboard("campaigns", current_user.id, service.get_campaigns(current_user.id))
 
 
-@router.get("/activity", response_model=List[DashboardActivityItem])
-async def get_dashboard_activity(
+@router.get("/activity", responses={200: {"model": List[DashboardActivityItem]}})
+def get_dashboard_activity(
     current_user: User = Depends(get_current_user),
-    db=Depends(get_db),
+    service: DashboardService = Depends(get_dashboard_service),
 ):
     """Recent activity (applications, interviews) for the authenticated user."""
-    service = DashboardService(db)
-    return service.get_activity(current_user.id)
+    cached = _get_cached_dashboard("activity", current_user.id)
+    if cached is not None:
+        return cached
+    return _cache_dashboard("activity", current_user.id, service.get_activity(current_user.id))
 
 
 @router.post("/campaigns/{campaign_id}/pause")
-async def pause_campaign(
+def pause_campaign(
     campaign_id: int,
     current_user: User = Depends(get_current_user),
-    db=Depends(get_db),
+    automation_service: AutomationService = Depends(get_automation_service),
 ):
     """Pause an automation (campaign)."""
-    automation_service = AutomationService(db)
     automation = automation_service.set_status(campaign_id, current_user.id, "paused")
     if not automation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Campaign not found",
         )
+    _invalidate_dashboard_cache(current_user.id)
     return {"status": "paused", "id": automation.id}
 
 
 @router.post("/campaigns/{campaign_id}/resume")
-async def resume_campaign(
+def resume_campaign(
     campaign_id: int,
     current_user: User = Depends(get_current_user),
-    db=Depends(get_db),
+    automation_service: AutomationService = Depends(get_automation_service),
 ):
     """Resume an automation (campaign)."""
-    automation_service = AutomationService(db)
     automation = automation_service.set_status(campaign_id, current_user.id, "running")
     if not automation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Campaign not found",
         )
+    _invalidate_dashboard_cache(current_user.id)
     return {"status": "running", "id": automation.id}
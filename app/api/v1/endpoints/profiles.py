@@ -1,37 +1,42 @@
 """
 User profile endpoints.
 """
-import json
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.database import get_db
 from app.schemas.profile import ProfileCreate, ProfileUpdate, ProfileResponse
 from app.services.profile_service import ProfileService
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_current_user, get_profile_service
 from app.models.profile import Profile
 
 router = APIRouter()
 
 
+def _initials(name: str) -> str:
+    """First letters of the first and last words, or the first two letters of a single word."""
+    name = name.strip()
+    if not name:
+        return ""
+    last = name.rsplit(maxsplit=1)
+    if len(last) == 2:
+        return (name[0] + last[1][0]).upper()
+    return name[:2].upper()
+
+
 def _profile_to_response(profile: Profile, user_full_name: str | None) -> ProfileResponse:
     """Build ProfileResponse with computed full_name and initials."""
-    full_name = None
-    if profile.first_name or profile.last_name:
-        full_name = f"{profile.first_name or ''} {profile.last_name or ''}".strip() or None
+    first, last = profile.first_name, profile.last_name
+    if first and last:
+        full_name = f"{first} {last}".strip() or None
+    else:
+        full_name = (first or last or "").strip() or None
     if not full_name and user_full_name:
         full_name = user_full_name
-    initials = ""
-    if full_name:
-        parts = full_name.strip().split()
-        if len(parts) >= 2:
-            initials = (parts[0][0] + parts[-1][0]).upper()
-        elif parts:
-            initials = parts[0][:2].upper() if len(parts[0]) >= 2 else parts[0][0].upper()
+    initials = _initials(full_name) if full_name else ""
     prefs = profile.matching_preferences
     if isinstance(prefs, str):
         try:
-            prefs = json.loads(prefs) if prefs else []
-        except json.JSONDecodeError:
+            prefs = orjson.loads(prefs) if prefs else []
+        except orjson.JSONDecodeError:
             prefs = []
     elif prefs is None:
         prefs = []
@@ -61,36 +66,33 @@ def _profile_to_response(profile: Profile, user_full_name: str | None) -> Profil
 
 
 @router.get("/me", response_model=ProfileResponse)
-async def get_current_profile(
+def get_current_profile(
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    profile_service: ProfileService = Depends(get_profile_service),
 ):
     """Get current user's profile."""
-    profile_service = ProfileService(db)
     profile = profile_service.get_or_create_profile(current_user.id, current_user.full_name)
     return _profile_to_response(profile, current_user.full_name)
 
 
 @router.post("/", response_model=ProfileResponse, status_code=status.HTTP_201_CREATED)
-async def create_profile(
+def create_profile(
     profile: ProfileCreate,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    profile_service: ProfileService = Depends(get_profile_service),
 ):
     """Create a new profile."""
-    profile_service = ProfileService(db)
     created = profile_service.create_profile(profile, current_user.id)
     return _profile_to_response(created, current_user.full_name)
 
 
 @router.put("/me", response_model=ProfileResponse)
-async def update_profile(
+def update_profile(
     profile_update: ProfileUpdate,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    profile_service: ProfileService = Depends(get_profile_service),
 ):
     """Update current user's profile."""
-    profile_service = ProfileService(db)
     profile = profile_service.update_profile(current_user.id, profile_update)
     if not profile:
         raise HTTPException(
@@ -3,13 +3,14 @@ User settings endpoints: account, email, password, 2FA, delete account.
 """
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from jose import JWTError, jwt
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from jose import JWTError
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.config import settings
-from app.api.dependencies import get_current_user
+from app.core.jwt_cache import decode_token
+from app.api.dependencies import get_auth_service, get_current_user, get_settings_service
 from app.models.user import User
 from app.schemas.settings import (
     SettingsDataOut,
@@ -20,29 +21,57 @@ from app.schemas.settings import (
 )
 from app.services.settings_service import SettingsService
 from app.services.auth_service import AuthService
-from app.utils.email import send_email
+from app.utils.email import send_email_quietly
 
 router = APIRouter()
 
+# Settings are frozen, so the email template parts can be fixed at import.
+_VERIFY_URL_PREFIX = f"{settings.FRONTEND_URL}/verify-email?token="
+_PROJECT_NAME = settings.PROJECT_NAME
+
+_VERIFY_SUBJECT = "Verify your email address"
+_VERIFY_TEXT_TEMPLATE = (
+    "Hi,\n\n"
+    "Please verify your email address for {project_name} by clicking the link below:\n\n"
+    "{verify_url}\n\n"
+    "If you did not request this, you can safely ignore this email."
+)
+_VERIFY_HTML_TEMPLATE = """
+    <html>
+      <body>
+        <p>Hi,</p>
+        <p>Please verify your email address for <strong>{project_name}</strong> by clicking the button below:</p>
+        <p style="margin:24px 0;">
+          <a href="{verify_url}"
+             style="background-color:#2563EB;color:#ffffff;padding:10px 18px;border-radius:6px;
+                    text-decoration:none;font-weight:600;display:inline-block;">
+            Verify email
+          </a>
+        </p>
+        <p>If the button does not work, copy and paste this URL into your browser:</p>
+        <p><a href="{verify_url}">{verify_url}</a></p>
+        <p>If you did not request this, you can safely ignore this email.</p>
+      </body>
+    </html>
+    """
+
 
 @router.get("", response_model=SettingsDataOut)
-async def get_settings(
+def get_settings(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    service: SettingsService = Depends(get_settings_service),
 ):
     """Get current user's settings (account, email, security flags)."""
-    service = SettingsService(db)
     return service.get_settings(current_user)
 
 
 @router.patch("/account", response_model=SettingsDataOut)
-async def update_account(
+def update_account(
     payload: UpdateAccountRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    service: SettingsService = Depends(get_settings_service),
 ):
     """Update display name and/or username."""
-    service = SettingsService(db)
     try:
         service.update_account(current_user, payload)
         return service.get_settings(current_user)
@@ -51,13 +80,12 @@ async def update_account(
 
 
 @router.post("/email", response_model=SettingsDataOut)
-async def update_email(
+def update_email(
     payload: UpdateEmailRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    service: SettingsService = Depends(get_settings_service),
 ):
     """Update email address. User may need to sign in again with the new email."""
-    service = SettingsService(db)
     try:
         service.update_email(current_user, payload.email)
         return service.get_settings(current_user)
@@ -66,72 +94,46 @@ async def update_email(
 
 
 @router.post("/email/verify")
-async def verify_email(
+def verify_email(
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """
     Request email verification.
 
     Sends an email with a one-time verification link. When the user clicks
-    the link, their email will be marked as verified.
+    the link, their email will be marked as verified. The email goes out after
+    the response, so SMTP latency and failures are not seen by the client.
     """
-    auth_service = AuthService(db)
     token = auth_service.create_access_token(
         data={"sub": str(current_user.id), "scope": "email_verify"},
         expires_delta=timedelta(hours=24),
     )
 
     # Frontend page that will call the confirm API and show a nice UI
-    verify_url = f"{settings.FRONTEND_URL}/verify-email?token={token}"
-
-    subject = "Verify your email address"
-    text_body = (
-        f"Hi,\n\n"
-        f"Please verify your email address for {settings.PROJECT_NAME} by clicking the link below:\n\n"
-        f"{verify_url}\n\n"
-        f"If you did not request this, you can safely ignore this email."
-    )
-    html_body = f"""
-    <html>
-      <body>
-        <p>Hi,</p>
-        <p>Please verify your email address for <strong>{settings.PROJECT_NAME}</strong> by clicking the button below:</p>
-        <p style="margin:24px 0;">
-          <a href="{verify_url}"
-             style="background-color:#2563EB;color:#ffffff;padding:10px 18px;border-radius:6px;
-                    text-decoration:none;font-weight:600;display:inline-block;">
-            Verify email
-          </a>
-        </p>
-        <p>If the button does not work, copy and paste this URL into your browser:</p>
-        <p><a href="{verify_url}">{verify_url}</a></p>
-        <p>If you did not request this, you can safely ignore this email.</p>
-      </body>
-    </html>
-    """
+    verify_url = _VERIFY_URL_PREFIX + token
 
-    try:
-        send_email(current_user.email, subject, text_body, html_body)
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to send verification email.",
-        )
+    fields = {"verify_url": verify_url, "project_name": _PROJECT_NAME}
+    text_body = _VERIFY_TEXT_TEMPLATE.format_map(fields)
+    html_body = _VERIFY_HTML_TEMPLATE.format_map(fields)
+
+    background_tasks.add_task(send_email_quietly, current_user.email, _VERIFY_SUBJECT, text_body, html_body)
 
     return {"message": "Verification email sent. Check your inbox."}
 
 
 @router.get("/email/verify/confirm")
-async def confirm_email(
+def confirm_email(
     token: str,
     db: Session = Depends(get_db),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
     """
     Verify email address from the token in the email link.
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_token(token)
         scope = payload.get("scope")
         sub = payload.get("sub")
         if scope != "email_verify" or sub is None:
@@ -143,26 +145,26 @@ async def confirm_email(
     except JWTError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired verification token.")
 
-    auth_service = AuthService(db)
     user = auth_service.get_user_by_id(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
 
+    # JSON response so the frontend page can show a rich UI.
+    if user.email_verified:
+        # Repeat click on the link: nothing to write.
+        return {"message": "Email already verified."}
     user.email_verified = True
     db.commit()
-
-    # JSON response so the frontend page can show a rich UI.
     return {"message": "Email verified."}
 
 
 @router.post("/password")
-async def change_password(
+def change_password(
     payload: ChangePasswordRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    service: SettingsService = Depends(get_settings_service),
 ):
     """Change password. Requires current password."""
-    service = SettingsService(db)
     try:
         service.change_password(current_user, payload.current_password, payload.new_password)
         return {"message": "Password updated."}
@@ -171,24 +173,22 @@ async def change_password(
 
 
 @router.post("/2fa")
-async def enable_2fa(
+def enable_2fa(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    service: SettingsService = Depends(get_settings_service),
 ):
     """Enable two-factor authentication. (Stub: full flow would set up TOTP.)"""
-    service = SettingsService(db)
     service.enable_2fa(current_user)
     return {"message": "2FA enabled.", "twoFactorEnabled": True}
 
 
 @router.delete("/account/delete")
-async def delete_account(
+def delete_account(
     payload: DeleteAccountRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    service: SettingsService = Depends(get_settings_service),
 ):
     """Soft-delete account (deactivate). Requires confirmation body: { \"confirmation\": \"DELETE\" }."""
-    service = SettingsService(db)
     try:
         service.delete_account(current_user, payload.confirmation)
         return {"message": "Account deactivated."}
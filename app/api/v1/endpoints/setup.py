@@ -1,16 +1,14 @@
 """
 Setup (onboarding) endpoints: personal details, resume upload, completion.
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status, UploadFile, File
 
-from app.core.database import get_db
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_current_user, get_user_setup_service
 from app.services.user_setup_service import UserSetupService
+from app.utils.files import cached_file_response
 from app.schemas.user_setup import (
     SetupStatusResponse,
     SetupDataOut,
@@ -39,21 +37,21 @@ def _setup_to_data_out(setup) -> Optional[SetupDataOut]:
     )
     resume_out: Optional[SetupResumeOut] = None
     if setup.resume_file_name and setup.resume_file_path:
+        uploaded_at = setup.updated_at or setup.created_at or datetime.now(timezone.utc)
         resume_out = SetupResumeOut(
             fileName=setup.resume_file_name,
-            uploadedAt=setup.updated_at.isoformat() if setup.updated_at else datetime.utcnow().isoformat(),
+            uploadedAt=uploaded_at.isoformat(),
             url="/api/v1/setup/resume",  # frontend uses this to download
         )
     return SetupDataOut(personal=personal, resume=resume_out)
 
 
 @router.get("/status", response_model=SetupStatusResponse)
-async def get_setup_status(
+def get_setup_status(
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    service: UserSetupService = Depends(get_user_setup_service),
 ):
     """Get current user's setup status and data."""
-    service = UserSetupService(db)
     setup = service.get_by_user_id(current_user.id)
     if not setup:
         return SetupStatusResponse(complete=False, data=None)
@@ -64,13 +62,12 @@ async def get_setup_status(
 
 
 @router.put("/personal", response_model=SetupDataOut)
-async def save_personal_details(
+def save_personal_details(
     personal: SetupPersonalDetails,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    service: UserSetupService = Depends(get_user_setup_service),
 ):
     """Save personal details (step 1)."""
-    service = UserSetupService(db)
     setup = service.update_personal(
         current_user.id,
         full_name=personal.full_name,
@@ -86,10 +83,10 @@ async def save_personal_details(
 
 
 @router.post("/resume")
-async def upload_resume(
+def upload_resume(
     file: UploadFile = File(...),
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    service: UserSetupService = Depends(get_user_setup_service),
 ):
     """Upload or replace resume file (PDF or DOCX). Max 5MB. Re-uploading overwrites the previous file."""
     if file.content_type and file.content_type not in ALLOWED_RESUME_TYPES:
@@ -97,28 +94,25 @@ async def upload_resume(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only PDF and DOC/DOCX files are allowed.",
         )
-    content = await file.read()
-    if len(content) > MAX_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File too large. Maximum size is 5MB.",
+    try:
+        file_name, _ = service.save_resume(
+            current_user.id, file.file, file.filename or "resume", max_bytes=MAX_SIZE
         )
-    service = UserSetupService(db)
-    file_name, _ = service.save_resume(current_user.id, content, file.filename or "resume")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     return {
         "fileName": file_name,
-        "uploadedAt": datetime.utcnow().isoformat(),
+        "uploadedAt": datetime.now(timezone.utc).isoformat(),
         "url": "/api/v1/setup/resume",
     }
 
 
 @router.post("/complete", response_model=SetupCompleteResponse)
-async def complete_setup(
+def complete_setup(
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    service: UserSetupService = Depends(get_user_setup_service),
 ):
     """Mark setup as complete. Requires resume and name/email."""
-    service = UserSetupService(db)
     try:
         service.complete_setup(current_user.id)
     except ValueError as e:
@@ -127,19 +121,14 @@ async def complete_setup(
 
 
 @router.get("/resume")
-async def download_resume(
+def download_resume(
+    request: Request,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    service: UserSetupService = Depends(get_user_setup_service),
 ):
     """Download current user's uploaded resume."""
-    service = UserSetupService(db)
     result = service.get_resume_path(current_user.id)
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No resume uploaded.")
     original_name, path = result
-    media_type = "application/pdf" if (original_name or "").lower().endswith(".pdf") else "application/octet-stream"
-    return FileResponse(
-        path=str(path),
-        filename=original_name,
-        media_type=media_type,
-    )
+    return cached_file_response(request, path, original_name)
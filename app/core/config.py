@@ -3,7 +3,7 @@ Application configuration settings loaded from environment / .env.
 """
 from typing import List, Optional
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -19,11 +19,37 @@ class Settings(BaseSettings):
 
     # Database (configure in .env as DATABASE_URL=...)
     DATABASE_URL: Optional[str] = None
+    # Connection pool (per worker process). Set DB_USE_NULLPOOL=true when an external
+    # pooler such as PgBouncer sits in front of Postgres and should own the connections.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_USE_NULLPOOL: bool = False
 
     # Security (set a strong SECRET_KEY in .env)
     SECRET_KEY: str = "change-me-in-env"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # How long a freshly signed access token is handed out again for the same claims (seconds)
+    ACCESS_TOKEN_CACHE_TTL_SECONDS: int = 15
+    # How long an authenticated user's row is reused before re-reading it (seconds). Changes
+    # are evicted on commit in the same process; other workers see them after at most this long.
+    USER_CACHE_TTL_SECONDS: int = 10
+    # How long a verified JWT payload is reused for the same token (seconds)
+    JWT_VERIFY_CACHE_TTL_SECONDS: int = 30
+    # How long admin dashboard stats/alerts are served from cache (seconds)
+    ADMIN_DASHBOARD_CACHE_TTL_SECONDS: int = 30
+    # How long a user's own dashboard stats/campaigns/activity are served from cache (seconds)
+    USER_DASHBOARD_CACHE_TTL_SECONDS: int = 5
+    # How long site-wide limits (e.g. max automations per user) are cached per process (seconds)
+    SITE_SETTINGS_CACHE_TTL_SECONDS: int = 60
+    # Login attempts per (client IP, username) and sign-ups per client IP: burst size and refill rate
+    AUTH_RATE_LIMIT_BURST: int = 10
+    AUTH_RATE_LIMIT_PER_MINUTE: int = 10
+    # Login attempts per client IP across all usernames (caps password spraying from one address)
+    AUTH_IP_RATE_LIMIT_BURST: int = 60
+    AUTH_IP_RATE_LIMIT_PER_MINUTE: int = 60
 
     # Job Application Settings
     DEFAULT_RESUME_PATH: Optional[str] = None
@@ -41,6 +67,8 @@ class Settings(BaseSettings):
     ADZUNA_APP_ID: Optional[str] = None
     ADZUNA_API_KEY: Optional[str] = None
     ADZUNA_BASE_URL: str = "https://api.adzuna.com/v1/api/jobs"
+    # Seconds identical Adzuna searches are served from memory
+    ADZUNA_CACHE_TTL_SECONDS: int = 60
 
     # Email / SMTP (all should come from .env in real use)
     SMTP_HOST: Optional[str] = None
@@ -54,10 +82,9 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
 
-    class Config:
-        # .env lives in the app/ directory (e.g. app/.env)
-        env_file = "app/.env"
-        case_sensitive = True
+    # .env lives in the app/ directory (e.g. app/.env). Frozen: settings are read
+    # once at startup, so modules may safely copy values into constants.
+    model_config = SettingsConfigDict(env_file="app/.env", case_sensitive=True, frozen=True)
 
 
 settings = Settings()
@@ -2,26 +2,42 @@
 Database configuration and session management.
 """
 from sqlalchemy import create_engine, pool
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from app.core.config import settings
 
 
+if settings.DB_USE_NULLPOOL:
+    pool_options = {"poolclass": pool.NullPool}
+else:
+    pool_options = {
+        "poolclass": pool.QueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
 engine = create_engine(
     settings.DATABASE_URL,
-    poolclass=pool.NullPool,
-    connect_args={}
+    connect_args={},
+    **pool_options,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base for all models (SQLAlchemy 2.0 style; Column() attributes still map as-is)."""
 
 
 
 def get_db():
     """
     Database dependency for FastAPI routes.
+
+    Each request gets its own Session. A thread-scoped registry (scoped_session)
+    does not fit here: sync dependencies and endpoints run on arbitrary threadpool
+    threads, so one thread's Session could be handed to two in-flight requests.
     """
     db = SessionLocal()
     try:
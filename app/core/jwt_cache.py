@@ -0,0 +1,44 @@
+"""
+JWT signing key and cached verification.
+"""
+import hashlib
+import time
+from threading import Lock
+
+from cachetools import TTLCache
+from jose import jwk, jwt
+from jose.exceptions import ExpiredSignatureError
+
+from app.core.config import settings
+
+_ALGORITHMS = [settings.ALGORITHM]
+
+# The app secret as a ready HMAC key; passing a Key object lets python-jose skip
+# re-validating and re-encoding the raw secret on every sign and verify.
+SIGNING_KEY = jwk.construct(settings.SECRET_KEY, settings.ALGORITHM)
+
+# Verified payloads keyed by a digest of the token; a client presents the same
+# bearer token on every request, so most decodes are repeats.
+_verified: TTLCache = TTLCache(maxsize=10_000, ttl=settings.JWT_VERIFY_CACHE_TTL_SECONDS)
+_verified_lock = Lock()
+
+
+def decode_token(token: str) -> dict:
+    """
+    Verify and decode a JWT signed with the app secret (raises JWTError).
+
+    Valid payloads are reused for JWT_VERIFY_CACHE_TTL_SECONDS; "exp" is still
+    checked on every call. Callers must not mutate the returned dict.
+    """
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    with _verified_lock:
+        payload = _verified.get(key)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is not None and exp <= time.time():
+            raise ExpiredSignatureError("Signature has expired.")
+        return payload
+    payload = jwt.decode(token, SIGNING_KEY, algorithms=_ALGORITHMS)
+    with _verified_lock:
+        _verified[key] = payload
+    return payload
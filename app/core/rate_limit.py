@@ -0,0 +1,37 @@
+"""
+In-process token-bucket rate limiting.
+"""
+import time
+from threading import Lock
+from typing import Hashable
+
+from cachetools import TTLCache
+
+
+class TokenBucketLimiter:
+    """
+    One token bucket per key: up to `capacity` requests at once, refilled at
+    `per_minute` tokens per minute. Buckets that have sat long enough to be full
+    again are evicted, so idle keys cost nothing.
+    """
+
+    def __init__(self, capacity: int, per_minute: float, maxsize: int = 100_000):
+        self.capacity = capacity
+        self.rate = per_minute / 60.0
+        self._buckets: TTLCache = TTLCache(maxsize=maxsize, ttl=capacity / self.rate)
+        self._lock = Lock()
+
+    def acquire(self, key: Hashable) -> float:
+        """
+        Take one token for key. Returns 0 when allowed, otherwise the seconds
+        until a token becomes available.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last) * self.rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                return 0.0
+            self._buckets[key] = (tokens, now)
+        return (1 - tokens) / self.rate
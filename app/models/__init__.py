@@ -7,6 +7,7 @@ from app.models.automation import Automation
 from app.models.site_settings import SiteSettings
 from app.models.audit_log import AuditLog
 from app.models.company import Company
+from app.models.admin_counter import AdminCounter
 
 __all__ = [
     "User",
@@ -19,4 +20,5 @@ __all__ = [
     "SiteSettings",
     "AuditLog",
     "Company",
+    "AdminCounter",
 ]
@@ -0,0 +1,21 @@
+"""
+Precomputed counts for the admin dashboard.
+"""
+from sqlalchemy import Column, String, BigInteger
+
+from app.core.database import Base
+
+
+class AdminCounter(Base):
+    """
+    One named running count (users, active_jobs, running_automations).
+
+    On PostgreSQL the rows are kept current by triggers on users, jobs and
+    automations (see migration u6p7q8r9s0t1); elsewhere the table stays empty
+    and readers fall back to live COUNTs.
+    """
+
+    __tablename__ = "admin_counters"
+
+    key = Column(String(64), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
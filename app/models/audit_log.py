@@ -2,25 +2,37 @@
 AuditLog model – records admin and system actions for audit trail.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index, text
 from sqlalchemy.sql import func
 
 from app.core.database import Base
 
 
 class AuditLog(Base):
-    """Audit log entry (immutable)."""
+    """
+    Audit log entry (immutable).
+
+    On PostgreSQL the table is range-partitioned by month on created_at, with
+    primary key (id, created_at); id alone stays unique via its sequence.
+    """
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Audit views list newest first: ORDER BY created_at DESC LIMIT n
+        Index("ix_audit_logs_created_at_desc", text("created_at DESC")),
+        # Filtered + newest first: WHERE actor|action = ? ORDER BY created_at DESC
+        Index("ix_audit_logs_actor_created", "actor", text("created_at DESC")),
+        Index("ix_audit_logs_action_created", "action", text("created_at DESC")),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Who performed the action (email, username, or 'system')
-    actor = Column(String, nullable=False, index=True)
+    actor = Column(String, nullable=False)
 
     # Machine-readable action code, e.g. 'user.suspended', 'job.approved'
-    action = Column(String, nullable=False, index=True)
+    action = Column(String, nullable=False)
 
     # Short human-readable description of target, e.g. 'User #12', 'Job #442'
     target = Column(String, nullable=False)
@@ -1,7 +1,8 @@
 """
 Automation model – stores user-defined auto-apply rules.
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, JSON, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -12,6 +13,11 @@ class Automation(Base):
     """Automation rules for continuously applying to jobs for a user."""
 
     __tablename__ = "automations"
+    __table_args__ = (
+        Index("ix_automations_platforms_gin", "platforms", postgresql_using="gin"),
+        # Only running automations are looked up by status (scheduler, dashboards)
+        Index("ix_automations_running_user_id", "user_id", postgresql_where=text("status = 'running'")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -25,13 +31,14 @@ class Automation(Base):
     daily_limit = Column(Integer, nullable=False, default=25)  # max applications per day
 
     # Job boards / platforms (JSON array of strings, e.g. ["LinkedIn", "Indeed"])
-    platforms = Column(JSON, nullable=False, default=list)
+    # Stored as jsonb on PostgreSQL (GIN-indexed for containment filters)
+    platforms = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False, default=list)
 
     # Optional cover letter template used when applying
     cover_letter_template = Column(Text, nullable=True)
 
     # Status: "running" or "paused" (string for simplicity)
-    status = Column(String, nullable=False, default="paused", index=True)
+    status = Column(String, nullable=False, default="paused")
 
     # Simple counter of how many applications this automation has driven
     total_applied = Column(Integer, nullable=False, default=0)
@@ -39,6 +46,6 @@ class Automation(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    user = relationship("User", backref="automations")
+    user = relationship("User", back_populates="automations")
     user_jobs = relationship("UserJob", back_populates="automation")
 
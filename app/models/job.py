@@ -1,7 +1,7 @@
 """
 Job database model.
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -10,6 +10,25 @@ from app.core.database import Base
 class Job(Base):
     """Job model."""
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Trigram GIN indexes (pg_trgm) for ILIKE '%term%' search on title/company
+        Index("ix_jobs_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_jobs_company_trgm", "company", postgresql_using="gin", postgresql_ops={"company": "gin_trgm_ops"}),
+        # Admin jobs list: ORDER BY created_at DESC NULLS LAST, id DESC LIMIT/OFFSET or keyset
+        Index(
+            "ix_jobs_created_at_id", text("created_at DESC NULLS LAST"), text("id DESC")
+        ).ddl_if(dialect="postgresql"),
+        # Same ordering per moderation status (admin list ?status=..., /alerts pending count)
+        *(
+            Index(
+                f"ix_jobs_{st}_created_at_id",
+                text("created_at DESC NULLS LAST"),
+                text("id DESC"),
+                postgresql_where=text(f"status = '{st}'"),
+            ).ddl_if(dialect="postgresql")
+            for st in ("pending", "approved", "rejected")
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
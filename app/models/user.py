@@ -1,7 +1,7 @@
 """
 User database model.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -10,6 +10,22 @@ from app.core.database import Base
 class User(Base):
     """User model."""
     __tablename__ = "users"
+    __table_args__ = (
+        # Trigram GIN indexes (pg_trgm) for ILIKE '%term%' search on email/full_name
+        Index("ix_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        Index("ix_users_full_name_trgm", "full_name", postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"}),
+        # Admin users list: ORDER BY created_at DESC NULLS LAST, id DESC LIMIT/OFFSET or keyset
+        Index(
+            "ix_users_created_at_id", text("created_at DESC NULLS LAST"), text("id DESC")
+        ).ddl_if(dialect="postgresql"),
+        # Suspended users only (admin list ?status=suspended, /alerts count)
+        Index(
+            "ix_users_suspended_created_at_id",
+            text("created_at DESC NULLS LAST"),
+            text("id DESC"),
+            postgresql_where=text("is_active IS FALSE"),
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -31,4 +47,5 @@ class User(Base):
     company = relationship("Company", back_populates="user", uselist=False)
     user_setup = relationship("UserSetup", back_populates="user", uselist=False)
     user_jobs = relationship("UserJob", back_populates="user")
+    automations = relationship("Automation", back_populates="user")
 
@@ -3,7 +3,7 @@ UserJob – jobs that a user has saved or applied to.
 """
 import enum
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, UniqueConstraint, Enum
+from sqlalchemy import CheckConstraint, Column, Integer, String, Text, ForeignKey, DateTime, UniqueConstraint, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -27,13 +27,33 @@ class UserJob(Base):
     """User–job association: jobs the user has saved or applied to."""
 
     __tablename__ = "user_jobs"
-    __table_args__ = (UniqueConstraint("user_id", "job_id", name="uq_user_job"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "job_id", name="uq_user_job"),
+        CheckConstraint(
+            "status IN (" + ", ".join(f"'{s.value}'" for s in UserJobStatus) + ")",
+            name="ck_user_jobs_status",
+        ),
+        # Dashboard / list queries: WHERE user_id = ? [AND status = ?] ORDER BY applied_at DESC
+        Index("ix_user_jobs_user_status_applied", "user_id", "status", text("applied_at DESC")),
+        # My-jobs list pages: WHERE user_id = ? [AND status = ?] ORDER BY created_at DESC, id DESC
+        Index("ix_user_jobs_user_created_id", "user_id", text("created_at DESC"), text("id DESC")),
+        Index("ix_user_jobs_user_status_created_id", "user_id", "status", text("created_at DESC"), text("id DESC")),
+        # Company applicants list: WHERE job_id = ? ORDER BY applied_at DESC NULLS LAST, created_at DESC
+        Index(
+            "ix_user_jobs_job_applied_created", "job_id", text("applied_at DESC NULLS LAST"), text("created_at DESC")
+        ).ddl_if(dialect="postgresql"),
+        # Applications-today counters (index-only): WHERE automation_id IN (...) AND status = ? AND applied_at >= ?
+        Index("ix_user_jobs_automation_status_applied", "automation_id", "status", "applied_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
-    automation_id = Column(Integer, ForeignKey("automations.id", ondelete="SET NULL"), nullable=True, index=True)
-    status = Column(Enum(UserJobStatus), default=UserJobStatus.SAVED, nullable=False)
+    automation_id = Column(Integer, ForeignKey("automations.id", ondelete="SET NULL"), nullable=True)
+    # Plain VARCHAR holding UserJobStatus values, checked by ck_user_jobs_status. Reads
+    # return str (no enum conversion per row); UserJobStatus is a str enum, so
+    # comparisons against its members still hold.
+    status = Column(String(16), default=UserJobStatus.SAVED.value, nullable=False)
     applied_at = Column(DateTime(timezone=True), nullable=True)
     notes = Column(Text, nullable=True)
     resume_path = Column(String, nullable=True)
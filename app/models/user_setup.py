@@ -11,8 +11,8 @@ class UserSetup(Base):
     """One-time setup per user: personal details and resume."""
     __tablename__ = "user_setups"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
+    # 1:1 with users, so the user id is the primary key (no surrogate id)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
     full_name = Column(String, nullable=True)
     email = Column(String, nullable=True)
     phone = Column(String, nullable=True)
@@ -4,7 +4,9 @@ Automation schemas (Pydantic) for API I/O.
 from datetime import datetime
 from typing import List, Optional, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.base import TrustedORMResponse
 
 
 AutomationStatusLiteral = Literal["running", "paused"]
@@ -53,7 +55,7 @@ class AutomationUpdate(BaseModel):
     status: Optional[AutomationStatusLiteral] = None
 
 
-class AutomationResponse(AutomationBase):
+class AutomationResponse(AutomationBase, TrustedORMResponse):
     """Automation data returned to the frontend."""
 
     id: int
@@ -63,8 +65,7 @@ class AutomationResponse(AutomationBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AutomationRunResultResponse(BaseModel):
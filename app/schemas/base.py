@@ -0,0 +1,26 @@
+"""
+Shared schema base classes.
+"""
+from pydantic import BaseModel
+
+_MISSING = object()
+
+
+class TrustedORMResponse(BaseModel):
+    """Response schema that can be built from our own ORM rows without validation."""
+
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        """
+        Build the schema from an ORM object with model_construct (no validation).
+
+        Only for rows read from our own database, whose column types already match
+        the schema; inbound payloads still go through model_validate. Fields the
+        object does not have keep their schema defaults.
+        """
+        values = {}
+        for name in cls.model_fields:
+            value = getattr(obj, name, _MISSING)
+            if value is not _MISSING:
+                values[name] = value
+        return cls.model_construct(**values)
@@ -4,7 +4,9 @@ Job schemas.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from app.schemas.base import TrustedORMResponse
 
 
 class JobBase(BaseModel):
@@ -27,7 +29,7 @@ class JobCreate(JobBase):
     external_id: Optional[str] = None
 
 
-class JobResponse(JobBase):
+class JobResponse(JobBase, TrustedORMResponse):
     """Job response schema."""
 
     id: int
@@ -35,8 +37,7 @@ class JobResponse(JobBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class JobSearchParams(BaseModel):
@@ -1,7 +1,7 @@
 """
 Profile schemas.
 """
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 from typing import Optional, List
 
 
@@ -43,6 +43,5 @@ class ProfileResponse(ProfileBase):
     full_name: Optional[str] = None
     initials: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
@@ -4,7 +4,7 @@ User settings schemas.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class SettingsDataOut(BaseModel):
@@ -16,8 +16,7 @@ class SettingsDataOut(BaseModel):
     password_last_changed: Optional[str] = None  # human-readable or ISO date
     two_factor_enabled: bool = False
 
-    class Config:
-        from_attributes = False
+    model_config = ConfigDict(from_attributes=False)
 
 
 class UpdateAccountRequest(BaseModel):
@@ -2,9 +2,16 @@
 UserJob schemas.
 """
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict
 from app.models.user_job import UserJobStatus
+from app.schemas.base import TrustedORMResponse
+
+
+# Status as stored and returned (the user_jobs.status strings); requests validate with UserJobStatus.
+UserJobStatusLiteral = Literal[
+    "saved", "draft", "submitted", "reviewing", "interview", "rejected", "accepted", "withdrawn"
+]
 
 
 class UserJobBase(BaseModel):
@@ -33,18 +40,18 @@ class UserJobUpdate(BaseModel):
     cover_letter_path: Optional[str] = None
 
 
-class UserJobResponse(UserJobBase):
+class UserJobResponse(UserJobBase, TrustedORMResponse):
     """UserJob response schema."""
 
     id: int
     user_id: int
     automation_id: Optional[int] = None
+    status: UserJobStatusLiteral = "saved"
     applied_at: Optional[datetime] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserJobResponseWithJob(UserJobResponse):
@@ -52,8 +59,14 @@ class UserJobResponseWithJob(UserJobResponse):
 
     job: "JobResponse"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        """Build from a UserJob with its job loaded; the nested job is constructed too."""
+        resp = super().from_orm_trusted(obj)
+        resp.job = JobResponse.from_orm_trusted(obj.job)
+        return resp
 
 
 from app.schemas.job import JobResponse  # noqa: E402
@@ -4,7 +4,7 @@ Setup (onboarding) schemas.
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class SetupPersonalDetails(BaseModel):
@@ -16,8 +16,7 @@ class SetupPersonalDetails(BaseModel):
     years_experience: Optional[str] = None
     top_skills: Optional[str] = None
 
-    class Config:
-        extra = "ignore"  # allow camelCase from frontend if we add aliases
+    model_config = ConfigDict(extra="ignore")  # allow camelCase from frontend if we add aliases
 
 
 class SetupResumeOut(BaseModel):
@@ -249,7 +249,7 @@ def seed_user_jobs(db: Session, users: list[User], jobs: list[Job], automations:
         seen.add(key)
         autos = auto_by_user.get(user.id, [])
         automation_id = choice(autos).id if autos and randint(0, 1) else None
-        status = choice(list(UserJobStatus))
+        status = choice(list(UserJobStatus)).value
         uj = UserJob(
             user_id=user.id,
             job_id=job.id,
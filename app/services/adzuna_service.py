@@ -1,12 +1,40 @@
 """
 Adzuna API client for fetching job listings.
 """
+from threading import Lock
 from typing import Any, Optional
 
 import httpx
+from cachetools import TTLCache
 
 from app.core.config import settings
 
+# One connection pool per process so repeated fetches reuse TCP/TLS sessions.
+_client: Optional[httpx.AsyncClient] = None
+
+# Normalized results of recent searches, keyed by (country, keyword, location, page).
+_search_cache: TTLCache = TTLCache(maxsize=1_000, ttl=settings.ADZUNA_CACHE_TTL_SECONDS)
+_search_cache_lock = Lock()
+
+
+def get_adzuna_client() -> httpx.AsyncClient:
+    """Return the process-wide Adzuna HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        )
+    return _client
+
+
+async def close_adzuna_client() -> None:
+    """Close the shared client (application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 class AdzunaService:
     """Service for fetching jobs from Adzuna API."""
@@ -16,7 +44,9 @@ class AdzunaService:
         app_id: Optional[str] = None,
         app_key: Optional[str] = None,
         base_url: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
     ):
+        self.client = client
         self.app_id = app_id or settings.ADZUNA_APP_ID
         self.app_key = app_key or settings.ADZUNA_API_KEY
         self.base_url = (base_url or settings.ADZUNA_BASE_URL).rstrip("/")
@@ -63,6 +93,12 @@ class AdzunaService:
         if not self.app_id or not self.app_key:
             raise ValueError("ADZUNA_APP_ID and ADZUNA_API_KEY must be set in config or .env")
 
+        key = (country, keyword, location, page)
+        with _search_cache_lock:
+            cached = _search_cache.get(key)
+        if cached is not None:
+            return list(cached[0]), cached[1]
+
         url = f"{self.base_url}/{country}/search/{page}"
         params = {
             "app_id": self.app_id,
@@ -72,12 +108,14 @@ class AdzunaService:
             "content-type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        client = self.client or get_adzuna_client()
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        data = response.json()
 
         results = data.get("results") or []
         total = data.get("count", 0)
         normalized = [self._normalize_job(j) for j in results]
-        return normalized, total
+        with _search_cache_lock:
+            _search_cache[key] = (normalized, total)
+        return list(normalized), total
@@ -26,7 +26,10 @@ class AuditService:
         ip: str = "-",
     ) -> AuditLog:
         """
-        Create a new audit entry.
+        Add a new audit entry to the session.
+
+        The entry is not committed here: the caller commits it together with the
+        change it describes, so the mutation and its audit row share one transaction.
 
         - actor.email is preferred; falls back to username or 'system'
         - action is a short machine code like 'user.suspended'
@@ -49,8 +52,6 @@ class AuditService:
             ip=ip or "-",
         )
         self.db.add(entry)
-        self.db.commit()
-        self.db.refresh(entry)
         return entry
 
     def list_entries(
@@ -64,7 +65,7 @@ class AuditService:
         query = self.db.query(AuditLog)
 
         if search:
-            s = f"%{search.lower()}%"
+            s = f"%{search}%"
             query = query.filter(
                 or_(
                     AuditLog.actor.ilike(s),
@@ -1,8 +1,14 @@
 """
 Authentication service.
 """
+import hashlib
+from threading import Lock
+
 import bcrypt
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, joinedload, make_transient_to_detached, object_session
 from datetime import datetime, timedelta
 from jose import jwt
 from app.models.user import User
@@ -10,6 +16,7 @@ from app.models.company import Company
 from app.schemas.auth import UserCreate
 from app.schemas.company import CompanyRegister
 from app.core.config import settings
+from app.core.jwt_cache import SIGNING_KEY
 
 
 def _truncate_for_bcrypt(password: str, max_bytes: int = 72) -> bytes:
@@ -23,14 +30,77 @@ def _hash_password(password: str) -> str:
     return bcrypt.hashpw(_truncate_for_bcrypt(password), bcrypt.gensalt()).decode("ascii")
 
 
+# Checked against when the email is unknown, so a failed login costs one bcrypt
+# round either way and response time does not reveal which accounts exist.
+_DUMMY_PASSWORD_HASH = _hash_password("dummy-password-for-timing")
+
+
 def _verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its bcrypt hash."""
+    """
+    Verify a password against its bcrypt hash.
+
+    bcrypt releases the GIL while hashing and the auth endpoints are sync, so
+    concurrent logins already spread over the threadpool across all cores.
+    """
     return bcrypt.checkpw(
         _truncate_for_bcrypt(plain_password),
         hashed_password.encode("ascii"),
     )
 
 
+# Column snapshots of recently authenticated users, keyed by a digest of the
+# bearer token. Only plain values are cached (never ORM instances), so each
+# request re-attaches its own copy to its own session.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=settings.USER_CACHE_TTL_SECONDS)
+_user_cache_lock = Lock()
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def _snapshot(user: User) -> dict:
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop every cached snapshot of the given user (e.g. after an account change)."""
+    with _user_cache_lock:
+        stale = [key for key, snap in _user_cache.items() if snap["id"] == user_id]
+        for key in stale:
+            _user_cache.pop(key, None)
+
+
+# Users changed in a session are evicted only once that session commits: evicting
+# at flush time would let a concurrent request re-cache the still-committed old row.
+# Other worker processes see the change when their snapshot expires.
+_PENDING_EVICTIONS = "auth_evict_user_ids"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _mark_user_for_eviction(mapper, connection, target) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_EVICTIONS, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed_users(session) -> None:
+    for user_id in session.info.pop(_PENDING_EVICTIONS, ()):
+        invalidate_cached_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_evictions(session) -> None:
+    session.info.pop(_PENDING_EVICTIONS, None)
+
+
+# Recently issued access tokens, keyed by their claims (always far from expiry).
+_issued_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=settings.ACCESS_TOKEN_CACHE_TTL_SECONDS)
+_issued_token_cache_lock = Lock()
+
+
 class AuthService:
     """Service for authentication operations."""
 
@@ -38,8 +108,33 @@ class AuthService:
         self.db = db
 
     def get_user_by_email(self, email: str) -> User | None:
-        """Get user by email."""
-        return self.db.query(User).filter(User.email == email).first()
+        """Get user by email (company profile, if any, loaded in the same SELECT)."""
+        return (
+            self.db.query(User)
+            .options(joinedload(User.company))
+            .filter(User.email == email)
+            .first()
+        )
+
+    def get_user_for_token(self, token: str, email: str) -> User | None:
+        """
+        Get the user a verified token belongs to.
+
+        Reuses a recent snapshot of the row when the same token was seen within
+        USER_CACHE_TTL_SECONDS, attaching it to this session without a SELECT.
+        """
+        key = _token_key(token)
+        with _user_cache_lock:
+            snapshot = _user_cache.get(key)
+        if snapshot is not None and snapshot["email"] == email:
+            user = User(**snapshot)
+            make_transient_to_detached(user)
+            return self.db.merge(user, load=False)
+        user = self.get_user_by_email(email)
+        if user is not None:
+            with _user_cache_lock:
+                _user_cache[key] = _snapshot(user)
+        return user
 
     def get_user_by_id(self, user_id: int) -> User | None:
         """Get user by ID."""
@@ -57,6 +152,7 @@ class AuthService:
         """Authenticate a user."""
         user = self.get_user_by_email(email)
         if not user:
+            self.verify_password(password, _DUMMY_PASSWORD_HASH)
             return None
         if not self.verify_password(password, user.hashed_password):
             return None
@@ -101,13 +197,25 @@ class AuthService:
         return db_user
 
     def create_access_token(self, data: dict, expires_delta: timedelta | None = None) -> str:
-        """Create a JWT access token."""
-        to_encode = data.copy()
+        """
+        Create a JWT access token.
+
+        Tokens with the default lifetime are reused for the same claims for
+        ACCESS_TOKEN_CACHE_TTL_SECONDS, so repeated logins skip re-signing.
+        """
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-        return encoded_jwt
+            return self._encode_token(data, expires_delta)
+        key = hashkey(*sorted(data.items()))
+        with _issued_token_cache_lock:
+            token = _issued_token_cache.get(key)
+        if token is None:
+            token = self._encode_token(data, timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+            with _issued_token_cache_lock:
+                _issued_token_cache[key] = token
+        return token
+
+    def _encode_token(self, data: dict, expires_delta: timedelta) -> str:
+        to_encode = data.copy()
+        to_encode.update({"exp": datetime.utcnow() + expires_delta})
+        return jwt.encode(to_encode, SIGNING_KEY, algorithm=settings.ALGORITHM)
 
@@ -3,9 +3,10 @@ Service layer for Automation – user-defined auto-apply rules.
 """
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.orm import Session, contains_eager, joinedload, raiseload
 
 from app.models.automation import Automation
 from app.models.user import User
@@ -38,6 +39,37 @@ class AutomationService:
             .all()
         )
 
+    def list_automations_with_applications_today(
+        self, user_id: int
+    ) -> List[Tuple[Automation, int]]:
+        """
+        Return (automation, applications_today) pairs for a user in one query.
+
+        Today's SUBMITTED counts are grouped per automation in a subquery and
+        outer-joined onto the list, so automations without applications get 0.
+        """
+        today_start = datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        today_counts = (
+            select(UserJob.automation_id, func.count().label("n"))
+            .join(Automation, Automation.id == UserJob.automation_id)
+            .where(
+                Automation.user_id == user_id,
+                UserJob.status == UserJobStatus.SUBMITTED,
+                UserJob.applied_at >= today_start,
+            )
+            .group_by(UserJob.automation_id)
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(Automation, func.coalesce(today_counts.c.n, 0))
+            .outerjoin(today_counts, today_counts.c.automation_id == Automation.id)
+            .where(Automation.user_id == user_id)
+            .order_by(Automation.created_at.desc())
+        ).all()
+        return [(automation, count) for automation, count in rows]
+
     def get_automation_for_user(self, automation_id: int, user_id: int) -> Optional[Automation]:
         """Fetch a single automation by id for the given user."""
         return (
@@ -65,9 +97,20 @@ class AutomationService:
             .count()
         )
 
-    def create_automation(self, user_id: int, data: AutomationCreate) -> Automation:
-        """Create a new automation for the given user (starts paused by default)."""
-        automation = Automation(
+    def create_automation(
+        self,
+        user_id: int,
+        data: AutomationCreate,
+        max_automations: Optional[int] = None,
+    ) -> Optional[Automation]:
+        """
+        Create a new automation for the given user (starts paused by default).
+
+        With max_automations, the cap is checked by the INSERT itself and None is
+        returned when the user is already at the limit. The user's row is locked
+        first so concurrent creates for one user cannot both slip under the cap.
+        """
+        values = dict(
             user_id=user_id,
             name=data.name or "Untitled automation",
             target_titles=data.target_titles,
@@ -76,8 +119,28 @@ class AutomationService:
             platforms=data.platforms or [],
             cover_letter_template=data.cover_letter_template,
             status="paused",
+            total_applied=0,
         )
-        self.db.add(automation)
+        if max_automations is None:
+            automation = Automation(**values)
+            self.db.add(automation)
+        else:
+            self.db.execute(select(User.id).where(User.id == user_id).with_for_update())
+            owned = (
+                select(func.count())
+                .select_from(Automation)
+                .where(Automation.user_id == user_id)
+                .scalar_subquery()
+            )
+            row = select(
+                *(literal(v, Automation.__table__.c[k].type) for k, v in values.items())
+            ).where(owned < max_automations)
+            automation = self.db.scalars(
+                insert(Automation).from_select(list(values), row).returning(Automation)
+            ).first()
+            if automation is None:
+                self.db.rollback()
+                return None
         self.db.commit()
         self.db.refresh(automation)
         return automation
@@ -130,10 +193,17 @@ class AutomationService:
         """List all automations with user loaded (for admin). Optional search by name or user email."""
         from sqlalchemy import or_
 
+        # Populate Automation.user from the search join itself (one users join, not two),
+        # loading only the columns the admin table shows; any other lazy load raises.
         query = (
             self.db.query(Automation)
-            .options(joinedload(Automation.user))
-            .join(User, Automation.user_id == User.id)
+            .join(Automation.user)
+            .options(
+                contains_eager(Automation.user).load_only(
+                    User.full_name, User.username, User.email
+                ),
+                raiseload("*"),
+            )
         )
         if search and search.strip():
             term = f"%{search.strip()}%"
@@ -151,7 +221,7 @@ class AutomationService:
         """Get any automation by id (for admin)."""
         return (
             self.db.query(Automation)
-            .options(joinedload(Automation.user))
+            .options(joinedload(Automation.user).load_only(User.full_name, User.username, User.email))
             .filter(Automation.id == automation_id)
             .first()
         )
@@ -175,14 +245,19 @@ class AutomationService:
         self.db.refresh(automation)
         return automation
 
-    def set_status_admin(self, automation_id: int, status: str) -> Optional[Automation]:
-        """Set status of any automation (admin)."""
+    def set_status_admin(
+        self, automation_id: int, status: str, commit: bool = True
+    ) -> Optional[Automation]:
+        """Set status of any automation (admin); only flushed when commit=False."""
         if status not in ("running", "paused"):
             return None
         automation = self.get_automation_by_id(automation_id)
         if not automation:
             return None
         automation.status = status
+        if not commit:
+            self.db.flush()
+            return automation
         self.db.commit()
         self.db.refresh(automation)
         return automation
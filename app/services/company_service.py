@@ -3,12 +3,13 @@ Company service – company profile and job management.
 """
 from typing import List, Optional
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from app.models.company import Company
 from app.models.job import Job
 from app.models.user import User
 from app.models.user_job import UserJob, UserJobStatus
+from app.models.user_setup import UserSetup
 from app.schemas.job import JobCreate
 
 
@@ -30,13 +31,21 @@ class CompanyService:
         )
         return {"total_jobs": total_jobs, "total_applicants": total_applicants}
 
-    def list_jobs_for_company(self, company_id: int) -> List[Job]:
-        return (
+    def list_jobs_for_company(self, company_id: int, batch_size: Optional[int] = None):
+        """
+        Jobs posted by the company, newest first.
+
+        With batch_size the rows are streamed from a server-side cursor in batches
+        of that size instead of being loaded into a list.
+        """
+        query = (
             self.db.query(Job)
             .filter(Job.company_id == company_id)
             .order_by(Job.created_at.desc())
-            .all()
         )
+        if batch_size:
+            return query.yield_per(batch_size)
+        return query.all()
 
     def get_job_for_company(self, job_id: int, company_id: int) -> Optional[Job]:
         return (
@@ -61,11 +70,16 @@ class CompanyService:
         job = self.get_job_for_company(job_id, company_id)
         if not job:
             return []
+        # Only the user/setup columns the applicants table reads (name, email, resume
+        # path); the wide user_setups text columns stay in the database.
         return (
             self.db.query(UserJob)
             .options(
-                joinedload(UserJob.user).joinedload(User.user_setup),
-                joinedload(UserJob.job),
+                joinedload(UserJob.user)
+                .load_only(User.email, User.full_name, User.username)
+                .joinedload(User.user_setup)
+                .load_only(UserSetup.resume_file_path),
+                raiseload("*"),
             )
             .filter(UserJob.job_id == job_id)
             .order_by(UserJob.applied_at.desc().nullslast(), UserJob.created_at.desc())
@@ -108,7 +122,7 @@ class CompanyService:
         }
         if new_status not in allowed:
             return None
-        uj.status = new_status
+        uj.status = new_status.value
         self.db.add(uj)
         self.db.commit()
         self.db.refresh(uj)
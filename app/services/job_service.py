@@ -3,7 +3,7 @@ Job service
 """
 from typing import Any, List, Optional
 
-from sqlalchemy import or_
+from sqlalchemy import insert, or_, select
 from sqlalchemy.orm import Session
 
 from app.models.job import Job
@@ -47,37 +47,51 @@ class JobService:
             query = query.filter(Job.source == search_params.source)
         return query.order_by(Job.created_at.desc()).offset(skip).limit(limit).all()
 
-    def create_job(self, job_create: JobCreate) -> Job:
-        """Create a job in the catalog (e.g. manual add)."""
+    def create_job(self, job_create: JobCreate, commit: bool = True) -> Job:
+        """
+        Create a job in the catalog (e.g. manual add).
+
+        With commit=False the row is only flushed (so it has an id) and the caller
+        commits, e.g. together with an audit entry.
+        """
         data = job_create.model_dump()
         # Default status to pending if not provided
         if not data.get("status"):
             data["status"] = "pending"
         db_job = Job(**data)
         self.db.add(db_job)
+        if not commit:
+            self.db.flush()
+            return db_job
         self.db.commit()
         self.db.refresh(db_job)
         return db_job
 
-    def update_job(self, job_id: int, data: dict) -> Optional[Job]:
-        """Update a job's fields."""
+    def update_job(self, job_id: int, data: dict, commit: bool = True) -> Optional[Job]:
+        """Update a job's fields (only flushed when commit=False)."""
         job = self.get_job(job_id)
         if not job:
             return None
         for key, value in data.items():
             if hasattr(job, key) and value is not None:
                 setattr(job, key, value)
+        if not commit:
+            self.db.flush()
+            return job
         self.db.commit()
         self.db.refresh(job)
         return job
 
-    def delete_job(self, job_id: int) -> bool:
-        """Delete a job."""
+    def delete_job(self, job_id: int, commit: bool = True) -> bool:
+        """Delete a job (only flushed when commit=False)."""
         job = self.get_job(job_id)
         if not job:
             return False
         self.db.delete(job)
-        self.db.commit()
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
         return True
 
     def get_or_create_by_url(
@@ -111,32 +125,58 @@ class JobService:
         """
         Add job dicts (e.g. from Adzuna) to the job catalog.
         Returns the list of Job instances (existing or newly created).
+
+        Known URLs are looked up in one query and new jobs go in as one
+        multi-row INSERT ... RETURNING instead of an add/refresh per job.
         """
-        result: List[Job] = []
+        existing_by_url: dict[str, Job] = {}
+        if skip_duplicate_url:
+            urls = {str(j["job_url"]) for j in jobs if j.get("job_url")}
+            if urls:
+                existing_by_url = {
+                    job.job_url: job
+                    for job in self.db.scalars(select(Job).where(Job.job_url.in_(urls)))
+                }
+
+        # Each slot is either an existing Job or the index of a row to insert.
+        slots: List[Any] = []
+        rows: List[dict[str, Any]] = []
+        new_row_by_url: dict[str, int] = {}
         for j in jobs:
-            job_url = j.get("job_url")
+            job_url = str(j["job_url"]) if j.get("job_url") else None
             if skip_duplicate_url and job_url:
-                existing = self.db.query(Job).filter(Job.job_url == str(job_url)).first()
-                if existing:
-                    result.append(existing)
+                if job_url in existing_by_url:
+                    slots.append(existing_by_url[job_url])
+                    continue
+                if job_url in new_row_by_url:
+                    slots.append(new_row_by_url[job_url])
                     continue
-            db_job = Job(
-                title=j.get("title") or "Untitled",
-                company=j.get("company") or "Unknown",
-                location=j.get("location"),
-                description=j.get("description"),
-                job_url=str(job_url) if job_url else None,
-                salary_range=j.get("salary_range"),
-                job_type=j.get("job_type"),
-                source=j.get("source") or "adzuna",
-                external_id=j.get("external_id"),
+                new_row_by_url[job_url] = len(rows)
+            slots.append(len(rows))
+            rows.append(
+                dict(
+                    title=j.get("title") or "Untitled",
+                    company=j.get("company") or "Unknown",
+                    location=j.get("location"),
+                    description=j.get("description"),
+                    job_url=job_url,
+                    salary_range=j.get("salary_range"),
+                    job_type=j.get("job_type"),
+                    source=j.get("source") or "adzuna",
+                    external_id=j.get("external_id"),
+                )
             )
-            self.db.add(db_job)
-            result.append(db_job)
+        if not rows:
+            return list(slots)
+
+        created = self.db.scalars(
+            insert(Job).returning(Job, sort_by_parameter_order=True), rows
+        ).all()
+        reload_ids = [job.id for job in created] + [job.id for job in existing_by_url.values()]
         self.db.commit()
-        for db_job in result:
-            self.db.refresh(db_job)
-        return result
+        # One SELECT re-populates every instance expired by the commit (new and known URLs).
+        self.db.scalars(select(Job).where(Job.id.in_(reload_ids))).all()
+        return [created[slot] if isinstance(slot, int) else slot for slot in slots]
 
     def find_matching_jobs_for_automation(
         self,
@@ -154,7 +194,7 @@ class JobService:
             query = query.filter(~Job.id.in_(exclude_job_ids))
 
         if target_titles and target_titles.strip():
-            keywords = [k.strip().lower() for k in target_titles.split(",") if k.strip()]
+            keywords = [k.strip() for k in target_titles.split(",") if k.strip()]
             if keywords:
                 or_clauses = []
                 for kw in keywords:
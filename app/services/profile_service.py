@@ -1,7 +1,7 @@
 """
 Profile service.
 """
-import json
+import orjson
 from sqlalchemy.orm import Session
 from app.models.profile import Profile
 from app.schemas.profile import ProfileCreate, ProfileUpdate
@@ -44,7 +44,7 @@ class ProfileService:
             out["first_name"] = parts[0] if parts else None
             out["last_name"] = parts[1] if len(parts) > 1 else None
         if "matching_preferences" in out and out["matching_preferences"] is not None:
-            out["matching_preferences"] = json.dumps(out["matching_preferences"])
+            out["matching_preferences"] = orjson.dumps(out["matching_preferences"]).decode()
         return out
 
     def create_profile(self, profile_create: ProfileCreate, user_id: int) -> Profile:
@@ -4,6 +4,7 @@ User settings service: account, email, password, 2FA, delete account.
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.user import User
@@ -32,9 +33,18 @@ def _format_password_changed(dt: Optional[datetime]) -> Optional[str]:
 
 
 class SettingsService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, auth_service: Optional[AuthService] = None):
         self.db = db
-        self.auth_service = AuthService(db)
+        self.auth_service = auth_service or AuthService(db)
+
+    def _commit_unique(self, user: User, conflict_message: str) -> None:
+        """Commit changes to user and reload it; a unique-constraint violation becomes ValueError."""
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise ValueError(conflict_message)
+        self.db.refresh(user)
 
     def get_settings(self, user: User) -> SettingsDataOut:
         """Build settings payload for the current user."""
@@ -52,26 +62,17 @@ class SettingsService:
         if payload.display_name is not None:
             user.full_name = payload.display_name.strip() or None
         if payload.username is not None:
-            username = payload.username.strip().lower() or None
-            if username:
-                existing = self.db.query(User).filter(User.username == username, User.id != user.id).first()
-                if existing:
-                    raise ValueError("Username already taken.")
-            user.username = username
-        self.db.commit()
-        self.db.refresh(user)
+            user.username = payload.username.strip().lower() or None
+        # users.username is unique: let the UPDATE detect a taken name instead of
+        # looking it up first.
+        self._commit_unique(user, "Username already taken.")
         return user
 
     def update_email(self, user: User, new_email: str) -> User:
         """Update user email. Caller should re-issue token or ask user to re-login."""
-        new_email = new_email.strip().lower()
-        existing = self.db.query(User).filter(User.email == new_email).first()
-        if existing and existing.id != user.id:
-            raise ValueError("Email already in use.")
-        user.email = new_email
+        user.email = new_email.strip().lower()
         user.email_verified = False  # require re-verification
-        self.db.commit()
-        self.db.refresh(user)
+        self._commit_unique(user, "Email already in use.")
         return user
 
     def change_password(self, user: User, current_password: str, new_password: str) -> None:
@@ -1,16 +1,41 @@
 """
 Site-wide settings (single row, id=1) for admin.
 """
+from threading import Lock
 from typing import Optional
 
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.site_settings import SiteSettings
 from app.schemas.admin import AdminSiteSettingsOut, AdminSiteSettingsUpdate
 
 
 SINGLETON_ID = 1
 
+# Snapshot of the row as AdminSiteSettingsOut (never the ORM row), shared by all
+# requests and cleared by update_settings. Callers must not mutate it.
+_settings_cache: TTLCache = TTLCache(maxsize=1, ttl=settings.SITE_SETTINGS_CACHE_TTL_SECONDS)
+_settings_cache_lock = Lock()
+
+
+def invalidate_site_settings_cache() -> None:
+    """Drop the cached snapshot; call after committing a change to the row."""
+    with _settings_cache_lock:
+        _settings_cache.clear()
+
+
+def _settings_out(row: SiteSettings) -> AdminSiteSettingsOut:
+    return AdminSiteSettingsOut.model_construct(
+        maintenance_mode=row.maintenance_mode,
+        new_user_registration=row.new_user_registration,
+        require_email_verification=row.require_email_verification,
+        max_automations_per_user=row.max_automations_per_user,
+        site_name=row.site_name or "CrypGo",
+        support_email=row.support_email or "support@crypgo.com",
+    )
+
 
 class SiteSettingsService:
     """Get or update the single site_settings row."""
@@ -37,23 +62,36 @@ class SiteSettingsService:
         return row
 
     def get_settings(self) -> AdminSiteSettingsOut:
-        """Return current site settings as API output."""
-        row = self.get_or_create()
-        return AdminSiteSettingsOut(
-            maintenance_mode=row.maintenance_mode,
-            new_user_registration=row.new_user_registration,
-            require_email_verification=row.require_email_verification,
-            max_automations_per_user=row.max_automations_per_user,
-            site_name=row.site_name or "CrypGo",
-            support_email=row.support_email or "support@crypgo.com",
-        )
-
-    def update_settings(self, update: AdminSiteSettingsUpdate) -> AdminSiteSettingsOut:
-        """Update site settings and return new state."""
+        """Return current site settings as API output, cached for SITE_SETTINGS_CACHE_TTL_SECONDS."""
+        with _settings_cache_lock:
+            cached = _settings_cache.get(SINGLETON_ID)
+        if cached is not None:
+            return cached
+        out = _settings_out(self.get_or_create())
+        with _settings_cache_lock:
+            _settings_cache[SINGLETON_ID] = out
+        return out
+
+    def get_max_automations_per_user(self) -> int:
+        """Per-user automation limit (from the cached settings)."""
+        return self.get_settings().max_automations_per_user or 10
+
+    def update_settings(
+        self, update: AdminSiteSettingsUpdate, commit: bool = True
+    ) -> AdminSiteSettingsOut:
+        """
+        Update site settings and return new state.
+
+        With commit=False the change is only flushed; the caller commits and then
+        calls invalidate_site_settings_cache().
+        """
         row = self.get_or_create()
         data = update.model_dump(exclude_unset=True)
         for key, value in data.items():
             setattr(row, key, value)
+        if not commit:
+            self.db.flush()
+            return _settings_out(row)
         self.db.commit()
-        self.db.refresh(row)
+        invalidate_site_settings_cache()
         return self.get_settings()
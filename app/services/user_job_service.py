@@ -4,7 +4,8 @@ UserJob service.
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from app.models.job import Job
 from app.models.user_job import UserJob, UserJobStatus
@@ -26,6 +27,15 @@ class UserJobService:
             .first()
         )
 
+    def _reload_with_job(self, user_job_id: int) -> UserJob:
+        """Re-read a just-committed user_job and its job in one joined SELECT."""
+        return (
+            self.db.query(UserJob)
+            .options(joinedload(UserJob.job))
+            .filter(UserJob.id == user_job_id)
+            .one()
+        )
+
     def get_user_jobs(
         self,
         user_id: int,
@@ -34,10 +44,10 @@ class UserJobService:
         status_filter: Optional[str] = None,
         automation_id: Optional[int] = None,
     ) -> List[UserJob]:
-        """Get user's saved/applied jobs (with job loaded)."""
+        """Get user's saved/applied jobs (with job loaded; other relationships raise on access)."""
         query = (
             self.db.query(UserJob)
-            .options(joinedload(UserJob.job))
+            .options(joinedload(UserJob.job), raiseload("*"))
             .filter(UserJob.user_id == user_id)
         )
         if status_filter:
@@ -48,6 +58,8 @@ class UserJobService:
                 pass
         if automation_id is not None:
             query = query.filter(UserJob.automation_id == automation_id)
+        # Stable newest-first pages, served in index order by ix_user_jobs_user_[status_]created_id
+        query = query.order_by(UserJob.created_at.desc(), UserJob.id.desc())
         return query.offset(skip).limit(limit).all()
 
     def get_user_jobs_for_automation(
@@ -98,7 +110,7 @@ class UserJobService:
         for job_id in job_ids:
             existing = self.get_by_user_and_job(user_id, job_id)
             if existing:
-                existing.status = UserJobStatus.SUBMITTED
+                existing.status = UserJobStatus.SUBMITTED.value
                 existing.applied_at = now
                 existing.automation_id = automation_id
                 self.db.add(existing)
@@ -108,7 +120,7 @@ class UserJobService:
                     user_id=user_id,
                     job_id=job_id,
                     automation_id=automation_id,
-                    status=UserJobStatus.SUBMITTED,
+                    status=UserJobStatus.SUBMITTED.value,
                     applied_at=now,
                 )
                 self.db.add(uj)
@@ -125,16 +137,14 @@ class UserJobService:
             if user_job_create.automation_id is not None:
                 existing.automation_id = user_job_create.automation_id
                 self.db.commit()
-                self.db.refresh(existing)
-            return existing
+            return self._reload_with_job(existing.id)
         db_user_job = UserJob(
             user_id=user_id,
-            **user_job_create.model_dump(),
+            **user_job_create.model_dump(mode="json"),
         )
         self.db.add(db_user_job)
         self.db.commit()
-        self.db.refresh(db_user_job)
-        return db_user_job
+        return self._reload_with_job(db_user_job.id)
 
     def add_user_jobs_for_jobs(
         self,
@@ -143,17 +153,28 @@ class UserJobService:
         status: UserJobStatus = UserJobStatus.SAVED,
     ) -> List[UserJob]:
         """Create UserJob for each job for the user (e.g. after fetching from Adzuna)."""
-        created: List[UserJob] = []
-        for job in jobs:
-            if self.get_by_user_and_job(user_id, job.id):
-                continue
-            uj = UserJob(user_id=user_id, job_id=job.id, status=status)
-            self.db.add(uj)
-            created.append(uj)
+        job_ids = list(dict.fromkeys(job.id for job in jobs))
+        if not job_ids:
+            return []
+        already_linked = set(
+            self.db.scalars(
+                select(UserJob.job_id).where(
+                    UserJob.user_id == user_id, UserJob.job_id.in_(job_ids)
+                )
+            )
+        )
+        rows = [
+            {"user_id": user_id, "job_id": job_id, "status": status.value}
+            for job_id in job_ids
+            if job_id not in already_linked
+        ]
+        if not rows:
+            return []
+        created = self.db.scalars(
+            insert(UserJob).returning(UserJob, sort_by_parameter_order=True), rows
+        ).all()
         self.db.commit()
-        for uj in created:
-            self.db.refresh(uj)
-        return created
+        return list(created)
 
     def update_user_job(
         self,
@@ -165,23 +186,21 @@ class UserJobService:
         uj = self.get_user_job(user_job_id, user_id)
         if not uj:
             return None
-        data = update.model_dump(exclude_unset=True)
+        data = update.model_dump(exclude_unset=True, mode="json")
         for k, v in data.items():
             setattr(uj, k, v)
         self.db.commit()
-        self.db.refresh(uj)
-        return uj
+        return self._reload_with_job(uj.id)
 
     def submit_user_job(self, user_job_id: int, user_id: int) -> Optional[UserJob]:
         """Mark user_job as submitted."""
         uj = self.get_user_job(user_job_id, user_id)
         if not uj:
             return None
-        uj.status = UserJobStatus.SUBMITTED
+        uj.status = UserJobStatus.SUBMITTED.value
         uj.applied_at = datetime.utcnow()
         self.db.commit()
-        self.db.refresh(uj)
-        return uj
+        return self._reload_with_job(uj.id)
 
     def delete_user_job(self, user_job_id: int, user_id: int) -> bool:
         """Remove a job from the user's list."""
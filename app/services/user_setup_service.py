@@ -5,13 +5,16 @@ import os
 import uuid
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from app.models.user_setup import UserSetup
 from app.models.user import User
 from app.core.config import settings
 
+# Bytes copied per read when saving an upload (bounds memory per request).
+_COPY_CHUNK_SIZE = 64 * 1024
+
 
 class UserSetupService:
     def __init__(self, db: Session):
@@ -57,9 +60,18 @@ class UserSetupService:
         self.db.refresh(setup)
         return setup
 
-    def save_resume(self, user_id: int, content: bytes, original_filename: str) -> tuple[str, str]:
-        """Save uploaded file content to disk and update setup. Returns (file_name, file_path)."""
-        setup = self.get_or_create(user_id)
+    def save_resume(
+        self,
+        user_id: int,
+        source: BinaryIO,
+        original_filename: str,
+        max_bytes: int,
+    ) -> tuple[str, str]:
+        """
+        Copy the uploaded file to disk in chunks and update setup. Returns (file_name, file_path).
+
+        Raises ValueError (and leaves nothing on disk) if the upload exceeds max_bytes.
+        """
         ext = Path(original_filename or "resume").suffix.lower()
         if ext not in (".pdf", ".doc", ".docx"):
             ext = ".pdf"
@@ -67,8 +79,18 @@ class UserSetupService:
         user_dir = self.upload_dir / str(user_id)
         user_dir.mkdir(parents=True, exist_ok=True)
         file_path = (user_dir / unique_name).resolve()
-        file_path.write_bytes(content)
+        written = 0
+        with file_path.open("wb") as out:
+            while chunk := source.read(_COPY_CHUNK_SIZE):
+                written += len(chunk)
+                if written > max_bytes:
+                    break
+                out.write(chunk)
+        if written > max_bytes:
+            file_path.unlink(missing_ok=True)
+            raise ValueError(f"File too large. Maximum size is {max_bytes // (1024 * 1024)}MB.")
 
+        setup = self.get_or_create(user_id)
         if setup.resume_file_path:
             old_path = Path(setup.resume_file_path)
             if old_path.exists():
@@ -99,7 +121,12 @@ class UserSetupService:
 
     def get_resume_path(self, user_id: int) -> Optional[tuple[str, Path]]:
         """Returns (original_file_name, path_on_disk) or None."""
-        setup = self.get_by_user_id(user_id)
+        setup = (
+            self.db.query(UserSetup)
+            .options(load_only(UserSetup.resume_file_name, UserSetup.resume_file_path))
+            .filter(UserSetup.user_id == user_id)
+            .first()
+        )
         if not setup or not setup.resume_file_path:
             return None
         path = Path(setup.resume_file_path)
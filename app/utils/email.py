@@ -38,3 +38,16 @@ def send_email(to_email: str, subject: str, text_body: str, html_body: str | Non
         logger.error("Failed to send email to %s: %s", to_email, exc)
         raise
 
+
+def send_email_quietly(to_email: str, subject: str, text_body: str, html_body: str | None = None) -> None:
+    """
+    Send an email, logging instead of raising on failure.
+
+    For use from BackgroundTasks, where the response has already gone out and
+    there is no caller left to handle the error.
+    """
+    try:
+        send_email(to_email, subject, text_body, html_body)
+    except Exception:
+        # send_email has already logged the failure.
+        pass
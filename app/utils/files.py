@@ -0,0 +1,54 @@
+"""
+File download helpers.
+"""
+import hashlib
+import os
+from pathlib import Path
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+RESUME_CACHE_CONTROL = "private, max-age=300"
+# Resumes are saved with a normalised lowercase suffix (see UserSetupService.save_resume).
+RESUME_MEDIA_TYPES = {
+    ".pdf": "application/pdf",
+    ".doc": "application/msword",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+# Read size when the server has no pathsend extension; resumes are capped at 5 MB.
+FILE_CHUNK_SIZE = 1024 * 1024
+
+
+def _etag(stat_result: os.stat_result) -> str:
+    token = f"{stat_result.st_size}-{stat_result.st_mtime_ns}".encode()
+    return '"%s"' % hashlib.blake2b(token, digest_size=16).hexdigest()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def cached_file_response(request: Request, path: Path, filename: str) -> Response:
+    """
+    Serve a private file with an ETag; answer 304 when the client already has this version.
+
+    FileResponse hands the path to servers that offer the http.response.pathsend
+    extension (sendfile in the server); otherwise it streams FILE_CHUNK_SIZE reads.
+    """
+    stat_result = os.stat(path)
+    etag = _etag(stat_result)
+    headers = {"ETag": etag, "Cache-Control": RESUME_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    media_type = RESUME_MEDIA_TYPES.get(path.suffix, "application/octet-stream")
+    response = FileResponse(
+        path=path,
+        filename=filename,
+        media_type=media_type,
+        headers=headers,
+        stat_result=stat_result,
+    )
+    response.chunk_size = FILE_CHUNK_SIZE
+    return response
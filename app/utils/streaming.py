@@ -0,0 +1,48 @@
+"""
+JSON helpers for list responses, streamed or in one body.
+"""
+from functools import lru_cache
+from typing import List, Sequence
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+# Rows fetched and encoded per chunk by streamed list responses.
+STREAM_BATCH_SIZE = 200
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: type) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def dump_json_list(items: Sequence[BaseModel]) -> bytes:
+    """
+    Encode same-schema models as a JSON array in one pydantic-core pass.
+
+    Skips the per-item model_dump() dicts and the second encode by orjson.
+    """
+    if not items:
+        return b"[]"
+    return _list_adapter(type(items[0])).dump_json(items)
+
+
+def json_list_response(items: Sequence[BaseModel], **kwargs) -> Response:
+    """Response whose body is dump_json_list(items); kwargs go to Response (headers, status_code)."""
+    return Response(content=dump_json_list(items), media_type="application/json", **kwargs)
+
+
+def stream_json_array(rows, to_schema, batch_size: int = STREAM_BATCH_SIZE):
+    """Yield rows as a JSON array, one encoded chunk per batch_size rows."""
+    yield b"["
+    sep = b""
+    batch = []
+    for row in rows:
+        batch.append(to_schema(row))
+        if len(batch) >= batch_size:
+            yield sep + dump_json_list(batch)[1:-1]
+            sep = b","
+            batch = []
+    if batch:
+        yield sep + dump_json_list(batch)[1:-1]
+    yield b"]"